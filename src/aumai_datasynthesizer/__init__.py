@@ -1,12 +1,16 @@
 """aumai-datasynthesizer — synthetic training data for agent testing."""
 
-from aumai_datasynthesizer.core import DataGenerator, SchemaBasedGenerator
-from aumai_datasynthesizer.models import (
-    ConversationTurn,
-    DataType,
-    GeneratorConfig,
-    SyntheticDataset,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aumai_datasynthesizer.core import DataGenerator, SchemaBasedGenerator
+    from aumai_datasynthesizer.models import (
+        ConversationTurn,
+        DataType,
+        GeneratorConfig,
+        SyntheticDataset,
+    )
 
 __version__ = "0.1.0"
 
@@ -18,3 +22,24 @@ __all__ = [
     "GeneratorConfig",
     "SyntheticDataset",
 ]
+
+# Public names and the submodule defining each.  They are imported on first
+# access, so importing the package (e.g. for ``aumai-datasynthesizer --help``)
+# does not load Faker or pydantic until they are actually needed.
+_LAZY_EXPORTS: dict[str, str] = {
+    "DataGenerator": "aumai_datasynthesizer.core",
+    "SchemaBasedGenerator": "aumai_datasynthesizer.core",
+    "ConversationTurn": "aumai_datasynthesizer.models",
+    "DataType": "aumai_datasynthesizer.models",
+    "GeneratorConfig": "aumai_datasynthesizer.models",
+    "SyntheticDataset": "aumai_datasynthesizer.models",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,45 @@
+"""Hot loops for conversation rendering, kept free of package imports.
+
+This module is plain, fully annotated Python so that it can be compiled to a
+C extension with mypyc (see the ``mypyc`` build hook in ``pyproject.toml``).
+The compiled and interpreted versions behave identically; the interpreted
+one is simply what gets imported when the wheel was built without the hook.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+# A template pre-split on its placeholders: the literal chunks, plus the Faker
+# method name and arguments for each placeholder between two chunks.
+CompiledText = tuple[tuple[str, ...], tuple[tuple[str, tuple[object, ...]], ...]]
+
+# A placeholder call with its Faker method already looked up.
+_BoundCall = tuple[Callable[..., object], tuple[object, ...]]
+
+
+def build_turn_dicts(
+    compiled_turns: tuple[tuple[str, CompiledText], ...], faker: object, count: int
+) -> list[list[dict[str, object]]]:
+    """Return *count* conversations rendered from *compiled_turns*.
+
+    Each turn is a dict with the keys of ``ConversationTurn.model_dump()``.
+    Placeholder methods are looked up on *faker* once per call, not once per
+    placeholder per sample.
+    """
+    bound_turns: list[tuple[str, tuple[str, ...], list[_BoundCall]]] = [
+        (role, literals, [(getattr(faker, attr), args) for attr, args in calls])
+        for role, (literals, calls) in compiled_turns
+    ]
+    conversations: list[list[dict[str, object]]] = []
+    for _ in range(count):
+        turns: list[dict[str, object]] = []
+        for role, literals, methods in bound_turns:
+            parts: list[str] = [literals[0]]
+            for i in range(len(methods)):
+                method, args = methods[i]
+                parts.append(str(method(*args)))
+                parts.append(literals[i + 1])
+            turns.append({"role": role, "content": "".join(parts), "tool_calls": None})
+        conversations.append(turns)
+    return conversations
@@ -3,13 +3,127 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
+import stat
 import sys
+import tempfile
+import time
+from typing import BinaryIO
 
 import click
 
-from aumai_datasynthesizer.core import DataGenerator
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None  # type: ignore[assignment]
+
 from aumai_datasynthesizer.models import DataType, GeneratorConfig
-from aumai_datasynthesizer.templates import CONVERSATION_TEMPLATES, TOOL_CALL_TEMPLATES
+from aumai_datasynthesizer.templates import (
+    TOOL_CALL_TEMPLATES,
+    TURN_COUNTS,
+)
+
+# Buffer size for --output files; large exports then hit the disk in 1 MiB
+# writes instead of one write per line.
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Serialised lines are collected into batches of about this many bytes and
+# handed to the output in a single write call.
+_WRITE_BATCH_SIZE = 1 << 16
+
+# Schema files above this size are parsed straight from a read-only mmap.
+_SCHEMA_MMAP_THRESHOLD = 16 << 20
+
+# orjson reads integers outside the 64-bit ranges as floats, so any parsed
+# float at least this large may be a rounded integer.
+_ORJSON_INT_LIMIT = float(1 << 63)
+
+
+def _dumps_line(sample: dict[str, object]) -> bytes:
+    """Serialise *sample* as one UTF-8 JSON Lines record, newline included.
+
+    The ``json`` path is written to produce the same compact, non-ASCII-escaped
+    lines as ``orjson``.  It also covers values ``orjson`` rejects, such as
+    integers wider than 64 bits.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(sample, default=str, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    line = json.dumps(sample, default=str, separators=(",", ":"), ensure_ascii=False)
+    return (line + "\n").encode("utf-8")
+
+
+def _has_wide_float(value: object) -> bool:
+    """Return whether *value* contains a float too large for a 64-bit integer.
+
+    ``orjson`` parses integers wider than 64 bits as floats, so such a float
+    may be a rounded integer bound.
+    """
+    if isinstance(value, float):
+        return abs(value) >= _ORJSON_INT_LIMIT
+    if isinstance(value, dict):
+        return any(_has_wide_float(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_has_wide_float(v) for v in value)
+    return False
+
+
+def _load_schema(schema_path: str) -> dict[str, object]:
+    """Parse the JSON Schema file at *schema_path*.
+
+    Uses ``orjson`` when it is installed, and re-parses with ``json`` when
+    that may have rounded a wide integer.  Large files are mapped into memory
+    rather than read into a separate buffer first.
+    """
+    with open(schema_path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size <= _SCHEMA_MMAP_THRESHOLD:
+            data = fh.read()
+            if orjson is not None:
+                schema = orjson.loads(data)
+                if not _has_wide_float(schema):
+                    return schema  # type: ignore[no-any-return]
+            return json.loads(data)  # type: ignore[no-any-return]
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if orjson is not None:
+                with memoryview(mapped) as view:
+                    schema = orjson.loads(view)
+                if not _has_wide_float(schema):
+                    return schema  # type: ignore[no-any-return]
+            return json.loads(mapped[:])  # type: ignore[no-any-return]
+
+
+def _open_output(output: str) -> tuple[BinaryIO, str | None]:
+    """Open the *output* file for writing; return it and its temporary path.
+
+    A regular file, or a path that does not exist yet, is written through a
+    temporary file in the same directory, which the caller renames over
+    *output* once generation succeeds, so a failed run leaves an existing
+    file untouched.  The temporary file gets the existing file's mode, or
+    the umask default for a new one.  Anything else (a symlink, FIFO or
+    device) is written in place, as renaming over it would replace the node
+    itself; the returned path is then ``None``.
+    """
+    is_regular = os.path.isfile(output) and not os.path.islink(output)
+    if os.path.lexists(output) and not is_regular:
+        return open(output, "wb", buffering=_WRITE_BUFFER_SIZE), None  # noqa: SIM115
+    if is_regular:
+        mode = stat.S_IMODE(os.stat(output).st_mode)
+    else:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    directory, name = os.path.split(os.path.abspath(output))
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=directory)
+    try:
+        os.chmod(tmp_path, mode)
+        return os.fdopen(fd, "wb", buffering=_WRITE_BUFFER_SIZE), tmp_path
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_path)
+        raise
 
 
 @click.group()
@@ -65,6 +179,13 @@ def main() -> None:
     metavar="KEY=VALUE",
     help="Constraint as KEY=VALUE pair. May be specified multiple times.",
 )
+@click.option(
+    "--workers",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Worker processes for runs larger than one 256-sample chunk.",
+)
 def generate_cmd(
     data_type: str,
     count: int,
@@ -72,12 +193,12 @@ def generate_cmd(
     output: str,
     schema_path: str | None,
     constraint_pairs: tuple[str, ...],
+    workers: int,
 ) -> None:
     """Generate synthetic data samples and write them as JSON Lines."""
     schema: dict[str, object] | None = None
     if schema_path is not None:
-        with open(schema_path, encoding="utf-8") as fh:
-            schema = json.load(fh)
+        schema = _load_schema(schema_path)
 
     constraints: dict[str, object] = {}
     for pair in constraint_pairs:
@@ -97,27 +218,53 @@ def generate_cmd(
         constraints=constraints,
     )
 
-    generator = DataGenerator()
-    dataset = generator.generate(config)
+    # Imported here so that --help and the templates command never load Faker.
+    from aumai_datasynthesizer.core import DataGenerator
 
-    click.echo(
-        f"Generated {len(dataset.samples)} {data_type} samples "
-        f"in {dataset.metadata.get('generation_time_ms', 0):.1f} ms.",
-        err=True,
-    )
+    generator = DataGenerator(workers=workers)
+    start = time.perf_counter()
 
+    out_fh: BinaryIO
+    tmp_path: str | None = None
     if output == "-":
-        out_fh = sys.stdout
+        sys.stdout.flush()
+        out_fh = sys.stdout.buffer
     else:
-        out_fh = open(output, "w", encoding="utf-8")  # noqa: SIM115
+        out_fh, tmp_path = _open_output(output)
 
+    # Samples are streamed straight to the output as they are generated, so
+    # the full dataset is never held in memory.
+    written = 0
+    batch = bytearray()
+    completed = False
     try:
-        for sample in dataset.samples:
-            out_fh.write(json.dumps(sample, default=str) + "\n")
+        for sample in generator.generate_iter(config):
+            batch += _dumps_line(sample)
+            written += 1
+            if len(batch) >= _WRITE_BATCH_SIZE:
+                out_fh.write(batch)
+                batch.clear()
+        out_fh.write(batch)
+        completed = True
     finally:
-        if output != "-":
+        if not completed and tmp_path is None:
+            # Samples generated before the failure still reach the output.
+            out_fh.write(batch)
+        if output == "-":
+            out_fh.flush()
+        else:
             out_fh.close()
+        if tmp_path is not None:
+            if completed:
+                os.replace(tmp_path, output)
+            else:
+                os.unlink(tmp_path)
 
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    click.echo(
+        f"Generated {written} {data_type} samples in {elapsed_ms:.1f} ms.",
+        err=True,
+    )
     if output != "-":
         click.echo(f"Output written to: {output}", err=True)
 
@@ -151,8 +298,8 @@ def templates_cmd(list_all: bool, category: str | None) -> None:
 
     if show_conversation:
         click.echo("\n--- Conversation Templates ---")
-        for name, turns in CONVERSATION_TEMPLATES.items():
-            click.echo(f"  {name}  ({len(turns)} turns)")
+        for name, turn_count in TURN_COUNTS.items():
+            click.echo(f"  {name}  ({turn_count} turns)")
 
     if show_tool_call:
         click.echo("\n--- Tool-Call Templates ---")
@@ -2,23 +2,39 @@
 
 from __future__ import annotations
 
-import copy
+import functools
+import itertools
 import json
+import os
 import random
 import re
+import threading
 import time
-import uuid
-from typing import Any
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from faker import Faker
+from faker import generator as _faker_generator
 
+from aumai_datasynthesizer._fast import CompiledText as _CompiledText
+from aumai_datasynthesizer._fast import build_turn_dicts as _build_turn_dicts
 from aumai_datasynthesizer.models import (
     ConversationTurn,
     DataType,
     GeneratorConfig,
     SyntheticDataset,
 )
-from aumai_datasynthesizer.templates import CONVERSATION_TEMPLATES, TOOL_CALL_TEMPLATES
+from aumai_datasynthesizer.templates import (
+    COMPILED_CONVERSATION_TEMPLATES,
+    CONVERSATION_TEMPLATES,
+    TOOL_CALL_TEMPLATES,
+    _compile_content,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -26,6 +42,42 @@ from aumai_datasynthesizer.templates import CONVERSATION_TEMPLATES, TOOL_CALL_TE
 
 _FAKER_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
 
+# Step kinds in a synthetic agent trace, and the tool-template keys a
+# tool_call step can pick from (TOOL_CALL_TEMPLATES is read-only, so the
+# tuple never goes stale).
+_STEP_TYPES = ("thought", "tool_call", "observation")
+_TOOL_KEYS_TUPLE = tuple(TOOL_CALL_TEMPLATES)
+
+# Faker for unseeded calls.  Building a Faker loads every provider, so calls
+# that do not need their own seeded instance share this one.
+_SHARED_FAKER = Faker()
+
+# The RNG every Faker shares until ``seed_instance`` gives it its own.
+# ``Faker.seed()`` reseeds it process-wide, and a forked child inherits its
+# state, so ids are never drawn from it.
+_UNSEEDED_FAKER_RANDOM = _faker_generator.random
+
+# Per-thread Faker reused, and re-seeded, by every seeded call on that thread,
+# so a seeded call costs a ``seed_instance`` rather than a new Faker.
+_SEEDED_FAKERS = threading.local()
+
+# Samples per chunk when a run is split up, both for worker-process tasks and
+# for streaming.  Chunk boundaries depend only on this constant (never on the
+# CPU count) so that a seeded dataset is identical on every machine.
+_CHUNK_SIZE = 256
+
+# Below this many samples a run is generated in one piece: the process-pool
+# start-up cost would outweigh the gain.
+_CHUNKING_MIN_COUNT = 64
+
+# Base timestamp for seeded agent traces (2023-11-14T22:13:20Z), so seeded
+# datasets are identical no matter when they are generated.
+_SEEDED_TRACE_EPOCH = 1_700_000_000.0
+
+# Set AUMAI_CODEGEN=1 to compile schemas into one generated Python function
+# each (see _codegen_plan) instead of a tree of closures.
+_CODEGEN_ENABLED = os.environ.get("AUMAI_CODEGEN") == "1"
+
 # Mapping from template placeholder names to Faker methods.
 _FAKER_ATTR_MAP: dict[str, str] = {
     "order_id": "numerify",
@@ -48,93 +100,524 @@ _FAKER_ATTR_MAP: dict[str, str] = {
 }
 
 
-def _resolve_placeholder(name: str, faker: Faker) -> str:
-    """Return a Faker-generated string for a template placeholder name."""
+# Lazily filled cache of conversation templates as (role, compiled content)
+# pairs, with each placeholder already mapped to its Faker call.
+_COMPILED_TEMPLATES: dict[str, tuple[tuple[str, _CompiledText], ...]] = {}
+
+
+def _placeholder_call(name: str) -> tuple[str, tuple[object, ...]]:
+    """Return the Faker method name and arguments for placeholder *name*."""
     attr = _FAKER_ATTR_MAP.get(name)
     if attr is None:
         # Fall back to a random word for unknown placeholders.
-        return str(faker.word())
+        return "word", ()
+    if attr == "numerify":
+        return attr, ("######",)
+    return attr, ()
+
+
+def _resolve_placeholder(name: str, faker: Faker) -> str:
+    """Return a Faker-generated string for a template placeholder name."""
+    attr, args = _placeholder_call(name)
     method = getattr(faker, attr, None)
     if callable(method):
-        result = method() if attr != "numerify" else method("######")
-        return str(result)
+        return str(method(*args))
     return str(faker.word())
 
 
 def _render_template(text: str, faker: Faker) -> str:
-    """Replace all {placeholder} tokens in *text* with Faker-generated values."""
+    """Replace all {placeholder} tokens in *text* with Faker-generated values.
+
+    *text* is split with the same parser as the conversation templates, so
+    doubled braces (``{{`` / ``}}``) render as literal braces here too.
+    """
+    literals, fields = _compile_content(text)
+    parts = [literals[0]]
+    for name, literal in zip(fields, literals[1:], strict=True):
+        parts.append(_resolve_placeholder(name, faker))
+        parts.append(literal)
+    return "".join(parts)
+
+
+def _compiled_conversation(name: str) -> tuple[tuple[str, _CompiledText], ...]:
+    """Return the compiled turns of conversation template *name*."""
+    compiled = _COMPILED_TEMPLATES.get(name)
+    if compiled is None:
+        compiled = tuple(
+            (role, (literals, tuple(_placeholder_call(f) for f in fields)))
+            for role, literals, fields in COMPILED_CONVERSATION_TEMPLATES[name]
+        )
+        _COMPILED_TEMPLATES[name] = compiled
+    return compiled
+
+
+def _bulk_uuids(n: int, rng: random.Random | None) -> list[str]:
+    """Return *n* random version-4 UUID strings from one bulk draw.
+
+    One draw replaces a ``uuid.uuid4()`` call (and its ``os.urandom``
+    syscall) per id.  A seeded *rng* makes the ids reproducible.  With
+    ``None``, or the RNG that unseeded Faker instances share, the bytes come
+    from ``os.urandom`` as they do for ``uuid4()``, so ids stay unique across
+    forked processes and after a process-wide ``Faker.seed()``.
+    """
+    if rng is None or rng is _UNSEEDED_FAKER_RANDOM:
+        raw = os.urandom(16 * n)
+    else:
+        raw = rng.randbytes(16 * n)
+    ids: list[str] = []
+    for pos in range(0, 16 * n, 16):
+        h = raw[pos : pos + 16].hex()
+        variant = "89ab"[int(h[16], 16) & 3]
+        ids.append(f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{variant}{h[17:20]}-{h[20:]}")
+    return ids
+
+
+# Encoder for tool-call arguments, built once.  Its output matches
+# json.dumps; the circular-reference check is skipped because arguments are
+# freshly generated trees that never refer back to themselves.
+_ARGUMENTS_ENCODER = json.JSONEncoder(check_circular=False).encode
 
-    def replace(match: re.Match[str]) -> str:
-        return _resolve_placeholder(match.group(1), faker)
 
-    return _FAKER_PLACEHOLDER_RE.sub(replace, text)
+def _dumps_arguments(arguments: dict[str, Any]) -> str:
+    """Return ``json.dumps(arguments)`` through the shared encoder."""
+    return _ARGUMENTS_ENCODER(arguments)
 
 
 # ---------------------------------------------------------------------------
-# SchemaBasedGenerator
+# Schema compilation
 # ---------------------------------------------------------------------------
 
+# A compiled schema node: produces one value per call from the given Faker
+# and random.Random.
+_Plan = Callable[[Faker, random.Random], Any]
 
-class SchemaBasedGenerator:
-    """Generate dicts that conform to a JSON Schema (subset: object/string/integer/boolean/array).
 
-    This is a lightweight generator — it does not depend on any third-party
-    JSON Schema library so it stays dependency-free while still being
-    practically useful for common schemas.
+# Plans for the supported string formats; anything else gets a short sentence.
+_STRING_FORMAT_PLANS: dict[str, _Plan] = {
+    "email": lambda faker, rng: faker.email(),
+    "date": lambda faker, rng: str(faker.date()),
+    "uri": lambda faker, rng: faker.url(),
+    "uuid": lambda faker, rng: _bulk_uuids(1, rng)[0],
+}
+
+
+def _sentence_plan(faker: Faker, rng: random.Random) -> str:
+    return str(faker.sentence(nb_words=4)).rstrip(".")
+
+
+def _build_string_plan(schema: dict[str, object]) -> _Plan:
+    enum = schema.get("enum")
+    if isinstance(enum, list) and enum:
+        options = tuple(enum)
+        return lambda faker, rng: rng.choice(options)
+    return _STRING_FORMAT_PLANS.get(str(schema.get("format", "")), _sentence_plan)
+
+
+def _build_integer_plan(schema: dict[str, object]) -> _Plan:
+    lo = int(schema.get("minimum", 0))  # type: ignore[call-overload]
+    stop = int(schema.get("maximum", 1000)) + 1  # type: ignore[call-overload]
+    return lambda faker, rng: rng.randrange(lo, stop)
+
+
+def _build_number_plan(schema: dict[str, object]) -> _Plan:
+    lo = float(schema.get("minimum", 0.0))  # type: ignore[arg-type]
+    hi = float(schema.get("maximum", 1.0))  # type: ignore[arg-type]
+    return lambda faker, rng: round(rng.uniform(lo, hi), 4)
+
+
+def _build_boolean_plan(schema: dict[str, object]) -> _Plan:
+    return lambda faker, rng: rng.randint(1, 100) <= 50
+
+
+def _build_null_plan(schema: dict[str, object]) -> _Plan:
+    return lambda faker, rng: None
+
+
+def _build_fallback_plan(schema: dict[str, object]) -> _Plan:
+    return lambda faker, rng: faker.word()
+
+
+# random.choices() indexes its population with int(random() * n), which is
+# only uniform below 2**53 and overflows once len() exceeds sys.maxsize.
+_MAX_CHOICES_SPAN = 1 << 53
+
+
+def _choice_population(schema: dict[str, object]) -> Sequence[object] | None:
+    """Return the values an integer or enum leaf picks from uniformly.
+
+    Returns ``None`` for any other kind of schema node, and for integer
+    ranges too wide for ``random.choices``; those draw each item with
+    ``randrange`` instead.
+    """
+    schema_type = str(schema.get("type", "string"))
+    if schema_type == "integer":
+        lo = int(schema.get("minimum", 0))  # type: ignore[call-overload]
+        hi = int(schema.get("maximum", 1000))  # type: ignore[call-overload]
+        if hi - lo >= _MAX_CHOICES_SPAN:
+            return None
+        return range(lo, hi + 1)
+    enum = schema.get("enum")
+    if schema_type == "string" and isinstance(enum, list) and enum:
+        return tuple(enum)
+    return None
+
+
+def _build_array_plan(schema: dict[str, object]) -> _Plan:
+    items_schema: dict[str, object] = schema.get(  # type: ignore[assignment]
+        "items", {"type": "string"}
+    )
+    min_items = int(schema.get("minItems", 1))  # type: ignore[call-overload]
+    stop = int(schema.get("maxItems", 5)) + 1  # type: ignore[call-overload]
+    population = _choice_population(items_schema)
+    if population is not None:
+        # Integer and enum items: draw the whole array in one choices() call.
+        def choices_plan(faker: Faker, rng: random.Random) -> list[Any]:
+            return rng.choices(population, k=rng.randrange(min_items, stop))
+
+        return choices_plan
+    item_plan = _build_plan(items_schema)
+
+    def plan(faker: Faker, rng: random.Random) -> list[Any]:
+        n = rng.randrange(min_items, stop)
+        return [item_plan(faker, rng) for _ in range(n)]
+
+    return plan
+
+
+def _build_object_plan(
+    schema: dict[str, object],
+) -> Callable[[Faker, random.Random], dict[str, object]]:
+    properties: dict[str, dict[str, object]] = schema.get(  # type: ignore[assignment]
+        "properties", {}
+    )
+    required: list[str] = schema.get("required", [])  # type: ignore[assignment]
+    required_set = set(required)
+    fields = tuple(
+        (name, _build_plan(prop_schema), name in required_set)
+        for name, prop_schema in properties.items()
+    )
+
+    if required_set >= properties.keys():
+        # Every property is always emitted: no per-field presence check.
+        def required_plan(faker: Faker, rng: random.Random) -> dict[str, object]:
+            return {name: field_plan(faker, rng) for name, field_plan, _ in fields}
+
+        return required_plan
+
+    def plan(faker: Faker, rng: random.Random) -> dict[str, object]:
+        result: dict[str, object] = {}
+        for name, field_plan, is_required in fields:
+            if is_required or rng.randint(1, 100) <= 80:
+                result[name] = field_plan(faker, rng)
+        return result
+
+    return plan
+
+
+# Plan builder for each JSON Schema "type"; unknown types fall back to a word.
+_PLAN_BUILDERS: dict[str, Callable[[dict[str, object]], _Plan]] = {
+    "object": _build_object_plan,
+    "string": _build_string_plan,
+    "integer": _build_integer_plan,
+    "number": _build_number_plan,
+    "boolean": _build_boolean_plan,
+    "array": _build_array_plan,
+    "null": _build_null_plan,
+}
+
+
+def _build_plan(schema: dict[str, object]) -> _Plan:
+    """Turn one schema node into a closure with its bounds and handlers bound."""
+    schema_type = str(schema.get("type", "string"))
+    return _PLAN_BUILDERS.get(schema_type, _build_fallback_plan)(schema)
+
+
+class _SourceEmitter:
+    """Emit Python source that generates one value for a schema.
+
+    The generated code makes exactly the same Faker/RNG calls, in the same
+    order, as the closure tree built by :func:`_build_plan`, so both produce
+    identical samples for the same seed.
     """
 
-    def __init__(self, faker: Faker) -> None:
-        self._faker = faker
+    def __init__(self) -> None:
+        self.namespace: dict[str, object] = {"_bulk_uuids": _bulk_uuids}
+        self.functions: list[str] = []
 
-    def from_schema(self, schema: dict[str, object], count: int) -> list[dict[str, object]]:
-        """Return *count* dicts matching *schema*."""
-        return [self._generate_object(schema) for _ in range(count)]
+    def const(self, value: object) -> str:
+        """Bind *value* in the namespace and return the name it is bound to."""
+        name = f"_c{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
 
-    def _generate_value(self, schema: dict[str, object]) -> Any:  # noqa: ANN401
-        schema_type = schema.get("type", "string")
+    def expr(self, schema: dict[str, object]) -> str:
+        """Return an expression over ``f`` (Faker) and ``rng`` for *schema*."""
+        schema_type = str(schema.get("type", "string"))
         if schema_type == "object":
-            return self._generate_object(schema)
+            return self._object_expr(schema)
         if schema_type == "string":
             enum = schema.get("enum")
             if isinstance(enum, list) and enum:
-                return self._faker.random_element(enum)
-            fmt = schema.get("format", "")
-            if fmt == "email":
-                return self._faker.email()
-            if fmt == "date":
-                return str(self._faker.date())
-            if fmt == "uri":
-                return self._faker.url()
-            if fmt == "uuid":
-                return str(uuid.uuid4())
-            return self._faker.sentence(nb_words=4).rstrip(".")
+                return f"rng.choice({self.const(tuple(enum))})"
+            return _STRING_FORMAT_SOURCES.get(
+                str(schema.get("format", "")), 'str(f.sentence(nb_words=4)).rstrip(".")'
+            )
         if schema_type == "integer":
-            minimum = int(schema.get("minimum", 0))  # type: ignore[arg-type]
-            maximum = int(schema.get("maximum", 1000))  # type: ignore[arg-type]
-            return self._faker.random_int(min=minimum, max=maximum)
+            lo = int(schema.get("minimum", 0))  # type: ignore[call-overload]
+            hi = int(schema.get("maximum", 1000))  # type: ignore[call-overload]
+            return f"rng.randrange({lo!r}, {hi + 1!r})"
         if schema_type == "number":
-            minimum = float(schema.get("minimum", 0.0))  # type: ignore[arg-type]
-            maximum = float(schema.get("maximum", 1.0))  # type: ignore[arg-type]
-            return round(random.uniform(minimum, maximum), 4)
+            lo_f = float(schema.get("minimum", 0.0))  # type: ignore[arg-type]
+            hi_f = float(schema.get("maximum", 1.0))  # type: ignore[arg-type]
+            return f"round(rng.uniform({self.const(lo_f)}, {self.const(hi_f)}), 4)"
         if schema_type == "boolean":
-            return self._faker.boolean()
+            return "rng.randint(1, 100) <= 50"
         if schema_type == "array":
-            items_schema = schema.get("items", {"type": "string"})
-            min_items = int(schema.get("minItems", 1))  # type: ignore[arg-type]
-            max_items = int(schema.get("maxItems", 5))  # type: ignore[arg-type]
-            n = self._faker.random_int(min=min_items, max=max_items)
-            return [self._generate_value(items_schema) for _ in range(n)]  # type: ignore[arg-type]
+            items_schema: dict[str, object] = schema.get(  # type: ignore[assignment]
+                "items", {"type": "string"}
+            )
+            min_items = int(schema.get("minItems", 1))  # type: ignore[call-overload]
+            max_items = int(schema.get("maxItems", 5))  # type: ignore[call-overload]
+            count = f"rng.randrange({min_items!r}, {max_items + 1!r})"
+            population = _choice_population(items_schema)
+            if population is not None:
+                return f"rng.choices({self.const(population)}, k={count})"
+            item = self.expr(items_schema)
+            return f"[{item} for _ in range({count})]"
         if schema_type == "null":
+            return "None"
+        return "f.word()"
+
+    def _object_expr(self, schema: dict[str, object]) -> str:
+        properties: dict[str, dict[str, object]]
+        properties = schema.get("properties", {})  # type: ignore[assignment]
+        required_set = set(schema.get("required", []))  # type: ignore[call-overload]
+        if required_set >= properties.keys():
+            items = ", ".join(
+                f"{name!r}: {self.expr(prop_schema)}"
+                for name, prop_schema in properties.items()
+            )
+            return f"{{{items}}}"
+        # Optional fields need statements, so the object gets its own function.
+        index = len(self.functions)
+        self.functions.append("")  # reserved: nested objects append after us
+        func = f"_obj{index}"
+        lines = [f"def {func}(f, rng):", "    result = {}"]
+        for name, prop_schema in properties.items():
+            assign = f"result[{name!r}] = {self.expr(prop_schema)}"
+            if name in required_set:
+                lines.append(f"    {assign}")
+            else:
+                lines.append("    if rng.randint(1, 100) <= 80:")
+                lines.append(f"        {assign}")
+        lines.append("    return result")
+        self.functions[index] = "\n".join(lines)
+        return f"{func}(f, rng)"
+
+
+# Source counterparts of _STRING_FORMAT_PLANS.
+_STRING_FORMAT_SOURCES: dict[str, str] = {
+    "email": "f.email()",
+    "date": "str(f.date())",
+    "uri": "f.url()",
+    "uuid": "_bulk_uuids(1, rng)[0]",
+}
+
+
+def _codegen_plan(schema: dict[str, object]) -> _Plan:
+    """Compile *schema* into a single generated function via ``exec``.
+
+    Every field is inlined into one expression (objects with optional fields
+    get a helper function each), which saves a Python call per schema node
+    per sample compared with the closure tree.
+    """
+    emitter = _SourceEmitter()
+    body = emitter.expr(schema)
+    source = "\n\n".join([*emitter.functions, f"def _gen(f, rng):\n    return {body}"])
+    namespace = emitter.namespace
+    exec(compile(source, "<aumai-schema>", "exec"), namespace)  # noqa: S102
+    return namespace["_gen"]  # type: ignore[return-value]
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_schema_key(key: str) -> _Plan:
+    schema = json.loads(key)
+    if _CODEGEN_ENABLED:
+        return _codegen_plan(schema)
+    return _build_plan(schema)
+
+
+def _compile_schema(schema: dict[str, object]) -> _Plan:
+    """Return the compiled plan for *schema*, reusing it for equal schemas.
+
+    The cache key is the schema's JSON text, so structurally identical
+    schemas share one plan no matter which dict object they arrive in.
+    """
+    try:
+        key = json.dumps(schema)
+    except (TypeError, ValueError):
+        # Not JSON-serialisable, hence not cacheable; compile it directly.
+        return _build_plan(schema)
+    return _compile_schema_key(key)
+
+
+# Bounds of the int64 values NumPy's integers() can draw.
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+
+def _vector_column(
+    schema: dict[str, object], np_rng: np.random.Generator, count: int
+) -> list[Any] | None:
+    """Draw *count* values for a numeric, boolean or enum leaf in one NumPy call.
+
+    Returns ``None`` for any other kind of schema node, and for integer
+    bounds that are reversed or outside int64; those columns fall back to
+    the compiled per-row plan.
+    """
+    schema_type = str(schema.get("type", "string"))
+    if schema_type == "integer":
+        lo = int(schema.get("minimum", 0))  # type: ignore[call-overload]
+        hi = int(schema.get("maximum", 1000))  # type: ignore[call-overload]
+        if not _INT64_MIN <= lo <= hi <= _INT64_MAX:
             return None
-        return self._faker.word()
+        ints: list[int] = np_rng.integers(lo, hi, size=count, endpoint=True).tolist()
+        return ints
+    if schema_type == "number":
+        lo_f = float(schema.get("minimum", 0.0))  # type: ignore[arg-type]
+        hi_f = float(schema.get("maximum", 1.0))  # type: ignore[arg-type]
+        floats: list[float] = np_rng.uniform(lo_f, hi_f, size=count).round(4).tolist()
+        return floats
+    if schema_type == "boolean":
+        bools: list[bool] = (np_rng.random(count) < 0.5).tolist()
+        return bools
+    if schema_type == "null":
+        return [None] * count
+    enum = schema.get("enum")
+    if schema_type == "string" and isinstance(enum, list) and enum:
+        picks: list[int] = np_rng.integers(0, len(enum), size=count).tolist()
+        return [enum[i] for i in picks]
+    return None
+
+
+def _text_column(
+    schema: dict[str, object], faker: Faker, rng: random.Random, count: int
+) -> list[Any] | None:
+    """Draw *count* values for a plain or formatted string leaf in one loop.
+
+    The Faker method is looked up once for the whole column, and UUIDs come
+    from :func:`_bulk_uuids`.  Returns ``None`` for any other kind of node.
+    """
+    if str(schema.get("type", "string")) != "string" or "enum" in schema:
+        return None
+    string_format = str(schema.get("format", ""))
+    if string_format == "uuid":
+        return _bulk_uuids(count, rng)
+    if string_format == "email":
+        email = faker.email
+        return [email() for _ in range(count)]
+    if string_format == "date":
+        date = faker.date
+        return [str(date()) for _ in range(count)]
+    if string_format == "uri":
+        url = faker.url
+        return [url() for _ in range(count)]
+    sentence = faker.sentence
+    return [str(sentence(nb_words=4)).rstrip(".") for _ in range(count)]
+
+
+# ---------------------------------------------------------------------------
+# SchemaBasedGenerator
+# ---------------------------------------------------------------------------
+
+
+class SchemaBasedGenerator:
+    """Generate dicts that conform to a JSON Schema (subset: object/string/integer/boolean/array).
+
+    This is a lightweight generator — it does not depend on any third-party
+    JSON Schema library so it stays dependency-free while still being
+    practically useful for common schemas.  Each schema is compiled once
+    into a tree of closures, so per-sample work is just calling that tree.
+    """
+
+    def __init__(self, faker: Faker, rng: random.Random | None = None) -> None:
+        self._faker = faker
+        # Non-text draws (numbers, booleans, enum picks, array lengths and
+        # optional-field presence) default to Faker's own RNG so that seeding
+        # the Faker instance seeds everything.
+        self._rng = rng if rng is not None else faker.random
+
+    def from_schema(self, schema: dict[str, object], count: int) -> list[dict[str, object]]:
+        """Return *count* dicts matching *schema*."""
+        plan = _compile_schema(schema)
+        faker, rng = self._faker, self._rng
+        return [plan(faker, rng) for _ in range(count)]
+
+    def bulk_generate(
+        self, schema: dict[str, object], count: int
+    ) -> list[dict[str, object]]:
+        """Return *count* dicts matching *schema*, generated column by column.
+
+        Integer, number, boolean, null and enum properties of a top-level
+        object schema are each drawn for all *count* rows in one NumPy call,
+        and string properties in one loop with the Faker method bound once;
+        every other property runs its compiled plan once per row, and
+        non-object schemas fall back to :meth:`from_schema`.  The NumPy
+        generator is seeded from this generator's RNG, so seeded runs are
+        reproducible, but the values differ from :meth:`from_schema`.
+
+        Requires the ``numpy`` extra.
+        """
+        try:
+            import numpy as np
+        except ImportError as exc:
+            raise ImportError(
+                "bulk_generate requires NumPy: "
+                "pip install 'aumai-datasynthesizer[numpy]'"
+            ) from exc
+
+        if str(schema.get("type", "string")) != "object":
+            return self.from_schema(schema, count)
+        properties: dict[str, dict[str, object]]
+        properties = schema.get("properties", {})  # type: ignore[assignment]
+        if not properties:
+            return [{} for _ in range(count)]
+        required_set = set(schema.get("required", []))  # type: ignore[call-overload]
+        faker, rng = self._faker, self._rng
+        np_rng = np.random.default_rng(rng.getrandbits(64))
+
+        columns: list[list[Any]] = []
+        for prop_schema in properties.values():
+            column = _vector_column(prop_schema, np_rng, count)
+            if column is None:
+                column = _text_column(prop_schema, faker, rng, count)
+            if column is None:
+                plan = _compile_schema(prop_schema)
+                column = [plan(faker, rng) for _ in range(count)]
+            columns.append(column)
+        keys = list(properties)
+        rows = [
+            dict(zip(keys, values, strict=True))
+            for values in zip(*columns, strict=True)
+        ]
+
+        optional = [name for name in keys if name not in required_set]
+        if optional:
+            # Each optional property is present in a row with 80% probability.
+            present: list[list[bool]] = (
+                np_rng.random((len(optional), count)) < 0.8
+            ).tolist()
+            for name, mask in zip(optional, present, strict=True):
+                for row, keep in zip(rows, mask, strict=True):
+                    if not keep:
+                        del row[name]
+        return rows
+
+    def _generate_value(self, schema: dict[str, object]) -> Any:  # noqa: ANN401
+        return _compile_schema(schema)(self._faker, self._rng)
 
     def _generate_object(self, schema: dict[str, object]) -> dict[str, object]:
-        properties: dict[str, object] = schema.get("properties", {})  # type: ignore[assignment]
-        required: list[str] = schema.get("required", [])  # type: ignore[assignment]
-        result: dict[str, object] = {}
-        for prop_name, prop_schema in properties.items():  # type: ignore[union-attr]
-            if prop_name in required or self._faker.boolean(chance_of_getting_true=80):
-                result[prop_name] = self._generate_value(prop_schema)  # type: ignore[arg-type]
+        result: dict[str, object] = _compile_schema(schema)(self._faker, self._rng)
         return result
 
 
@@ -146,20 +629,49 @@ class SchemaBasedGenerator:
 class DataGenerator:
     """Main dispatcher that generates synthetic datasets for all DataType values."""
 
-    def __init__(self, faker: Faker | None = None) -> None:
-        self._faker_default = faker  # will be overridden per-call if seed is set
+    def __init__(self, faker: Faker | None = None, workers: int = 1) -> None:
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        self._faker_default = faker  # will be re-seeded per call if seed is set
+        # Worker processes for chunked runs; 1 (the default) never starts a
+        # process pool, so scripts need no ``if __name__ == "__main__"`` guard.
+        self._workers = workers
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
     def _make_faker(self, config: GeneratorConfig) -> Faker:
-        faker = self._faker_default if self._faker_default is not None else Faker()
+        """Return the Faker for one call, seeded per instance when asked.
+
+        Seeding goes through ``seed_instance`` rather than the class-level
+        ``Faker.seed``, and seeded calls without a caller-supplied Faker use
+        a per-thread instance, so concurrent calls never share or clobber
+        RNG state.
+        """
+        if self._faker_default is not None:
+            faker = self._faker_default
+        elif config.seed is not None:
+            seeded: Faker | None = getattr(_SEEDED_FAKERS, "faker", None)
+            if seeded is None:
+                seeded = _SEEDED_FAKERS.faker = Faker()
+            faker = seeded
+        else:
+            return _SHARED_FAKER
         if config.seed is not None:
-            Faker.seed(config.seed)
-            random.seed(config.seed)
+            faker.seed_instance(config.seed)
         return faker
 
+    @staticmethod
+    def _make_rng(faker: Faker) -> random.Random:
+        """Return a private RNG for one call's non-Faker draws.
+
+        It is seeded from *faker*'s own RNG rather than with ``config.seed``,
+        so the two streams are independent instead of being the same
+        sequence, while a seeded Faker still makes the whole call reproducible.
+        """
+        return random.Random(faker.random.getrandbits(64))
+
     # ------------------------------------------------------------------
     # Public generators
     # ------------------------------------------------------------------
@@ -169,59 +681,68 @@ class DataGenerator:
         faker = self._make_faker(config)
         max_sentences: int = int(config.constraints.get("max_sentences", 5))
         min_sentences: int = int(config.constraints.get("min_sentences", 1))
+        # Draw every paragraph length first, then all sentences in one batch,
+        # and slice the batch into paragraphs.
+        lengths = [
+            faker.random_int(min=min_sentences, max=max_sentences)
+            for _ in range(config.count)
+        ]
+        sentences = faker.sentences(nb=sum(lengths))
         texts: list[str] = []
-        for _ in range(config.count):
-            nb = faker.random_int(min=min_sentences, max=max_sentences)
-            texts.append(faker.paragraph(nb_sentences=nb))
+        pos = 0
+        for nb in lengths:
+            texts.append(" ".join(sentences[pos : pos + nb]))
+            pos += nb
         return texts
 
-    def generate_conversations(
+    def _generate_turn_dicts(
         self, config: GeneratorConfig
-    ) -> list[list[ConversationTurn]]:
-        """Return a list of multi-turn conversations."""
+    ) -> list[list[dict[str, object]]]:
+        """Return conversations as plain turn dicts, skipping pydantic entirely.
+
+        Each dict has the same keys, in the same order, as
+        ``ConversationTurn.model_dump()``.
+        """
         faker = self._make_faker(config)
         template_name: str = str(
             config.constraints.get("template", "customer_support")
         )
-        template_turns: list[dict[str, object]] = CONVERSATION_TEMPLATES.get(
-            template_name, CONVERSATION_TEMPLATES["customer_support"]
+        if template_name not in CONVERSATION_TEMPLATES:
+            template_name = "customer_support"
+        return _build_turn_dicts(
+            _compiled_conversation(template_name), faker, config.count
         )
-        conversations: list[list[ConversationTurn]] = []
-        for _ in range(config.count):
-            turns: list[ConversationTurn] = []
-            for turn_dict in template_turns:
-                content = _render_template(str(turn_dict["content"]), faker)
-                turns.append(
-                    ConversationTurn(
-                        role=str(turn_dict["role"]),
-                        content=content,
-                        tool_calls=None,
-                    )
-                )
-            conversations.append(turns)
-        return conversations
+
+    def generate_conversations(
+        self, config: GeneratorConfig
+    ) -> list[list[ConversationTurn]]:
+        """Return a list of multi-turn conversations."""
+        return [
+            [ConversationTurn(**turn) for turn in turns]  # type: ignore[arg-type]
+            for turns in self._generate_turn_dicts(config)
+        ]
 
     def generate_tool_calls(self, config: GeneratorConfig) -> list[dict[str, object]]:
         """Return a list of synthetic tool-call dicts."""
         faker = self._make_faker(config)
+        rng = self._make_rng(faker)
         tool_name: str = str(config.constraints.get("tool", "search"))
-        template = copy.deepcopy(
-            TOOL_CALL_TEMPLATES.get(tool_name, TOOL_CALL_TEMPLATES["search"])
-        )
-        schema_gen = SchemaBasedGenerator(faker)
+        template = TOOL_CALL_TEMPLATES.get(tool_name, TOOL_CALL_TEMPLATES["search"])
         params_schema: dict[str, object] = template.get(  # type: ignore[assignment]
             "parameters", {}
         )
+        params_plan = _compile_schema(params_schema)
+        ids = _bulk_uuids(config.count, rng if config.seed is not None else None)
         results: list[dict[str, object]] = []
-        for _ in range(config.count):
-            arguments = schema_gen._generate_object(params_schema)  # noqa: SLF001
+        for call_id in ids:
+            arguments = params_plan(faker, rng)
             results.append(
                 {
-                    "id": str(uuid.uuid4()),
+                    "id": call_id,
                     "type": "function",
                     "function": {
                         "name": template["name"],
-                        "arguments": json.dumps(arguments),
+                        "arguments": _dumps_arguments(arguments),
                     },
                 }
             )
@@ -232,35 +753,66 @@ class DataGenerator:
     ) -> list[dict[str, object]]:
         """Return a list of synthetic agent execution traces."""
         faker = self._make_faker(config)
-        tool_keys = list(TOOL_CALL_TEMPLATES.keys())
+        rng = self._make_rng(faker)
+        count = config.count
+        # Decide every step type up front so the text for each kind of step
+        # can be generated in one batch per kind, then handed out in order.
+        trace_step_types = [
+            rng.choices(_STEP_TYPES, k=faker.random_int(min=2, max=6))
+            for _ in range(count)
+        ]
+        all_types = [t for types in trace_step_types for t in types]
+        n_tool_calls = all_types.count("tool_call")
+        thoughts = faker.sentences(nb=all_types.count("thought"))
+        observations = [
+            faker.paragraph(nb_sentences=2)
+            for _ in range(all_types.count("observation"))
+        ]
+        tools = rng.choices(_TOOL_KEYS_TUPLE, k=n_tool_calls)
+        queries = [faker.sentence(nb_words=4) for _ in range(n_tool_calls)]
+        # The type-specific fields of every step, handed out in step order.
+        payloads: dict[str, Iterator[dict[str, object]]] = {
+            "thought": iter([{"content": c} for c in thoughts]),
+            "tool_call": iter(
+                [
+                    {
+                        "tool": TOOL_CALL_TEMPLATES[key]["name"],
+                        "arguments": {"query": query},
+                    }
+                    for key, query in zip(tools, queries, strict=True)
+                ]
+            ),
+            "observation": iter([{"content": c} for c in observations]),
+        }
+        agents = faker.words(nb=count)
+        tasks = [faker.sentence(nb_words=6) for _ in range(count)]
+        final_answers = [faker.paragraph(nb_sentences=1) for _ in range(count)]
+        trace_ids = _bulk_uuids(count, rng if config.seed is not None else None)
+
+        base_ts = _SEEDED_TRACE_EPOCH if config.seed is not None else time.time()
         traces: list[dict[str, object]] = []
-        for _ in range(config.count):
-            num_steps = faker.random_int(min=2, max=6)
-            steps: list[dict[str, object]] = []
-            t = time.time()
-            for step_idx in range(num_steps):
-                step_type = faker.random_element(["thought", "tool_call", "observation"])
-                step: dict[str, object] = {
+        for i, step_types in enumerate(trace_step_types):
+            # Each step starts a random 0.1-2.0 s after the previous one.
+            delays = [rng.uniform(0.1, 2.0) for _ in range(len(step_types) - 1)]
+            timestamps = itertools.accumulate(delays, initial=base_ts)
+            steps: list[dict[str, object]] = [
+                {
                     "step": step_idx,
                     "type": step_type,
-                    "timestamp": t + step_idx * faker.pyfloat(min_value=0.1, max_value=2.0),
+                    "timestamp": timestamp,
+                    **next(payloads[step_type]),
                 }
-                if step_type == "thought":
-                    step["content"] = faker.sentence()
-                elif step_type == "tool_call":
-                    tool_key = faker.random_element(tool_keys)
-                    step["tool"] = TOOL_CALL_TEMPLATES[tool_key]["name"]
-                    step["arguments"] = {"query": faker.sentence(nb_words=4)}
-                else:
-                    step["content"] = faker.paragraph(nb_sentences=2)
-                steps.append(step)
+                for step_idx, (step_type, timestamp) in enumerate(
+                    zip(step_types, timestamps, strict=True)
+                )
+            ]
             traces.append(
                 {
-                    "trace_id": str(uuid.uuid4()),
-                    "agent": faker.word() + "_agent",
-                    "task": faker.sentence(nb_words=6),
+                    "trace_id": trace_ids[i],
+                    "agent": agents[i] + "_agent",
+                    "task": tasks[i],
                     "steps": steps,
-                    "final_answer": faker.paragraph(nb_sentences=1),
+                    "final_answer": final_answers[i],
                     "success": faker.boolean(chance_of_getting_true=80),
                 }
             )
@@ -269,61 +821,166 @@ class DataGenerator:
     def generate_json(self, config: GeneratorConfig) -> list[dict[str, object]]:
         """Return JSON objects — either schema-driven or free-form."""
         faker = self._make_faker(config)
+        rng = self._make_rng(faker)
         if config.schema:
-            schema_gen = SchemaBasedGenerator(faker)
+            # Unseeded runs leave the schema draws on Faker's RNG, which keeps
+            # uuid fields on os.urandom (see _bulk_uuids).
+            schema_rng = rng if config.seed is not None else None
+            schema_gen = SchemaBasedGenerator(faker, schema_rng)
             return schema_gen.from_schema(config.schema, config.count)
-        # Free-form random JSON objects.
+        # Free-form random JSON objects, with the string columns and the tag
+        # words generated in batches up front.
+        count = config.count
+        names = [faker.name() for _ in range(count)]
+        emails = [faker.email() for _ in range(count)]
+        values = [round(rng.uniform(0, 1000), 2) for _ in range(count)]
+        tag_counts = [faker.random_int(min=1, max=5) for _ in range(count)]
+        words = faker.words(nb=sum(tag_counts))
+        ids = _bulk_uuids(count, rng if config.seed is not None else None)
         results: list[dict[str, object]] = []
-        for _ in range(config.count):
+        pos = 0
+        for i, n_tags in enumerate(tag_counts):
             results.append(
                 {
-                    "id": str(uuid.uuid4()),
-                    "name": faker.name(),
-                    "email": faker.email(),
-                    "value": faker.pyfloat(min_value=0, max_value=1000, right_digits=2),
+                    "id": ids[i],
+                    "name": names[i],
+                    "email": emails[i],
+                    "value": values[i],
                     "active": faker.boolean(),
-                    "tags": [faker.word() for _ in range(faker.random_int(min=1, max=5))],
+                    "tags": words[pos : pos + n_tags],
                     "created_at": str(faker.date_time_this_year()),
                 }
             )
+            pos += n_tags
         return results
 
     # ------------------------------------------------------------------
     # Dispatcher
     # ------------------------------------------------------------------
 
-    def generate(self, config: GeneratorConfig) -> SyntheticDataset:
-        """Generate a full SyntheticDataset for the given config."""
-        start = time.perf_counter()
-
+    def _generate_samples(
+        self, config: GeneratorConfig, start: int = 0
+    ) -> list[dict[str, object]]:
+        """Generate ``config.count`` samples whose ``index`` values begin at *start*."""
         if config.data_type == DataType.text:
             raw = self.generate_text(config)
-            samples: list[dict[str, object]] = [
-                {"index": i, "text": t} for i, t in enumerate(raw)
-            ]
+            return [{"index": start + i, "text": t} for i, t in enumerate(raw)]
 
-        elif config.data_type == DataType.conversation:
-            raw_convs = self.generate_conversations(config)
-            samples = [
-                {
-                    "index": i,
-                    "turns": [turn.model_dump() for turn in turns],
-                }
+        if config.data_type == DataType.conversation:
+            raw_convs = self._generate_turn_dicts(config)
+            return [
+                {"index": start + i, "turns": turns}
                 for i, turns in enumerate(raw_convs)
             ]
 
-        elif config.data_type == DataType.tool_call:
+        if config.data_type == DataType.tool_call:
             raw_calls = self.generate_tool_calls(config)
-            samples = [{"index": i, **call} for i, call in enumerate(raw_calls)]
+            return [{"index": start + i, **call} for i, call in enumerate(raw_calls)]
 
-        elif config.data_type == DataType.agent_trace:
+        if config.data_type == DataType.agent_trace:
             raw_traces = self.generate_agent_traces(config)
-            samples = [{"index": i, **trace} for i, trace in enumerate(raw_traces)]
+            return [{"index": start + i, **trace} for i, trace in enumerate(raw_traces)]
+
+        # DataType.json
+        raw_json = self.generate_json(config)
+        return [{"index": start + i, **obj} for i, obj in enumerate(raw_json)]
+
+    @classmethod
+    def _generate_chunk(
+        cls, config: GeneratorConfig, start: int, end: int, sub_seed: int
+    ) -> list[dict[str, object]]:
+        """Generate samples ``[start, end)`` of *config* in a fresh generator.
+
+        Usually runs inside a worker process, so the chunk is generated with
+        its own Faker seeded from *sub_seed* rather than relying on RNG state
+        inherited from the parent.
+        """
+        chunk_config = cls._chunk_config(config, end - start, sub_seed)
+        if config.seed is None:
+            # Forked workers inherit the parent's Faker state, so an unseeded
+            # chunk gets a Faker of its own, randomly seeded from *sub_seed*.
+            faker = Faker()
+            faker.seed_instance(sub_seed)
+            return cls(faker)._generate_samples(chunk_config, start)
+        return cls()._generate_samples(chunk_config, start)
+
+    @staticmethod
+    def _chunk_config(
+        config: GeneratorConfig, count: int, sub_seed: int
+    ) -> GeneratorConfig:
+        """Return the config for one chunk of *config*.
+
+        Only seeded runs put *sub_seed* on the chunk: an unseeded chunk keeps
+        ``seed=None``, so it stays unseeded in every respect (for example,
+        agent-trace timestamps use the current time, not a fixed epoch).
+        """
+        if config.seed is None:
+            return config.model_copy(update={"count": count})
+        return config.model_copy(update={"count": count, "seed": sub_seed})
+
+    def _iter_chunks(
+        self, config: GeneratorConfig
+    ) -> Iterator[list[dict[str, object]]]:
+        """Split *config* into fixed-size chunks and yield each one in order.
+
+        Chunks are generated in-process unless the generator was built with
+        ``workers > 1``; a process pool then keeps at most two chunks per
+        worker in flight, so memory stays bounded however large
+        ``config.count`` is.  A custom Faker passed to the constructor cannot
+        be shipped to worker processes, so generators built with one always
+        produce their chunks in-process.
+        """
+        starts = range(0, config.count, _CHUNK_SIZE)
+        ends = [min(lo + _CHUNK_SIZE, config.count) for lo in starts]
+        if config.seed is not None:
+            sub_seeds = [hash((config.seed, idx)) for idx in range(len(starts))]
+        else:
+            # Only used by pool workers, to give each unseeded chunk its own
+            # Faker state (see _generate_chunk).
+            sub_seeds = [int.from_bytes(os.urandom(8), "big") for _ in starts]
+        chunk_args = zip(starts, ends, sub_seeds, strict=True)
+
+        n_workers = min(self._workers, len(starts))
+        if n_workers <= 1 or self._faker_default is not None:
+            for lo, hi, sub_seed in chunk_args:
+                chunk_config = self._chunk_config(config, hi - lo, sub_seed)
+                yield self._generate_samples(chunk_config, lo)
+            return
+
+        worker = type(self)._generate_chunk
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            pending: deque[Future[list[dict[str, object]]]] = deque()
+            for lo, hi, sub_seed in chunk_args:
+                pending.append(pool.submit(worker, config, lo, hi, sub_seed))
+                if len(pending) >= 2 * n_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def generate_iter(self, config: GeneratorConfig) -> Iterator[dict[str, object]]:
+        """Yield the samples for *config* one at a time, in ``index`` order.
+
+        Large runs are produced chunk by chunk, so peak memory is bounded by
+        the chunk size rather than by ``config.count``.  Seeded configs are
+        always chunked and each chunk is seeded from ``(seed, chunk index)``,
+        so seeded runs of any length share every complete chunk and yield the
+        same samples whatever ``workers`` is.
+        """
+        if config.seed is None and config.count < _CHUNKING_MIN_COUNT:
+            yield from self._generate_samples(config)
+            return
+        for chunk in self._iter_chunks(config):
+            yield from chunk
 
-        else:  # DataType.json
-            raw_json = self.generate_json(config)
-            samples = [{"index": i, **obj} for i, obj in enumerate(raw_json)]
+    def generate(self, config: GeneratorConfig) -> SyntheticDataset:
+        """Generate a full SyntheticDataset for the given config.
 
+        Large runs are split into chunks (generated in a process pool when
+        the generator has ``workers > 1``); see :meth:`generate_iter` to
+        stream samples without materialising them.
+        """
+        start = time.perf_counter()
+        samples = list(self.generate_iter(config))
         elapsed_ms = (time.perf_counter() - start) * 1000
         return SyntheticDataset(
             config=config,
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import string
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+
 # ---------------------------------------------------------------------------
 # Conversation templates
-# Each entry is a list of turn-dicts with "role" and "content" keys.
-# "content" values may contain {faker_*} placeholders resolved at generation
-# time via the Faker instance — see core.py DataGenerator._apply_template.
+# Each entry is a tuple of turn-dicts with "role" and "content" keys.
+# "content" values may contain {placeholder} tokens resolved at generation
+# time via the Faker instance; literal braces are doubled, as in str.format.
+# Generation reads the parallel CONVERSATION_ROLES / CONVERSATION_CONTENTS
+# tuples derived below; the turn-dict view is kept, read-only, for callers.
 # ---------------------------------------------------------------------------
 
-CONVERSATION_TEMPLATES: dict[str, list[dict[str, object]]] = {
-    "customer_support": [
+_CONVERSATION_TURNS: dict[str, tuple[dict[str, str], ...]] = {
+    "customer_support": (
         {
             "role": "system",
             "content": (
@@ -43,8 +50,8 @@ CONVERSATION_TEMPLATES: dict[str, list[dict[str, object]]] = {
             "role": "assistant",
             "content": "I've sent the tracking link to {email}. Is there anything else I can help you with?",
         },
-    ],
-    "code_assistant": [
+    ),
+    "code_assistant": (
         {
             "role": "system",
             "content": (
@@ -61,27 +68,29 @@ CONVERSATION_TEMPLATES: dict[str, list[dict[str, object]]] = {
             "content": (
                 "Here's how to {task} in Python:\n\n"
                 "```python\n"
+                "from collections import Counter\n\n"
                 "def {function_name}(items: list[str]) -> dict[str, int]:\n"
                 "    \"\"\"Return a frequency map of items.\"\"\"\n"
-                "    return {{item: items.count(item) for item in set(items)}}\n"
+                "    return dict(Counter(items))\n"
                 "```\n\n"
-                "This approach uses a dictionary comprehension for O(n) clarity."
+                "`Counter` counts every item in a single O(n) pass."
             ),
         },
         {"role": "user", "content": "What if the list is very large?"},
         {
             "role": "assistant",
             "content": (
-                "For large lists use `collections.Counter` — it's implemented in C "
-                "and far more efficient:\n\n"
+                "`Counter` already counts in C, so it scales linearly. If the "
+                "items do not fit in memory, feed them in chunks:\n\n"
                 "```python\n"
-                "from collections import Counter\n\n"
-                "counter = Counter(items)  # O(n), C-speed\n"
+                "counter = Counter()\n"
+                "for chunk in chunks:\n"
+                "    counter.update(chunk)  # O(n) overall, C-speed\n"
                 "```"
             ),
         },
-    ],
-    "research_assistant": [
+    ),
+    "research_assistant": (
         {
             "role": "system",
             "content": (
@@ -110,15 +119,88 @@ CONVERSATION_TEMPLATES: dict[str, list[dict[str, object]]] = {
                 "over {duration}. Data were analysed using {analysis_method}."
             ),
         },
-    ],
+    ),
 }
 
+# A content string split on its placeholders: the literal chunks, and the
+# placeholder names between them (always one fewer than the chunks).
+_CompiledContent = tuple[tuple[str, ...], tuple[str, ...]]
+
+
+def _compile_content(content: str) -> _CompiledContent:
+    """Split *content* into literal chunks and placeholder names, once."""
+    literals: list[str] = []
+    fields: list[str] = []
+    pending = ""
+    for literal, field_name, _spec, _conversion in string.Formatter().parse(content):
+        pending += literal
+        if field_name is not None:
+            literals.append(pending)
+            fields.append(field_name)
+            pending = ""
+    literals.append(pending)
+    return tuple(literals), tuple(fields)
+
+
+# Every table below is derived from the literals above once, at import, and
+# built with a dict comprehension straight from the source mapping.
+CONVERSATION_TEMPLATES: Mapping[str, tuple[Mapping[str, str], ...]] = MappingProxyType(
+    {
+        name: tuple(MappingProxyType(turn) for turn in turns)
+        for name, turns in _CONVERSATION_TURNS.items()
+    }
+)
+
+# The same templates as parallel per-template tuples of roles and contents.
+# Roles are interned, so every generated turn shares one string per role.
+CONVERSATION_ROLES: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        name: tuple(sys.intern(turn["role"]) for turn in turns)
+        for name, turns in _CONVERSATION_TURNS.items()
+    }
+)
+CONVERSATION_CONTENTS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        name: tuple(turn["content"] for turn in turns)
+        for name, turns in _CONVERSATION_TURNS.items()
+    }
+)
+
+# Number of turns in each template, as shown by ``templates --list``.
+TURN_COUNTS: Mapping[str, int] = MappingProxyType(
+    {name: len(turns) for name, turns in _CONVERSATION_TURNS.items()}
+)
+
+# The templates with every content string compiled at import time, as
+# (role, literal chunks, placeholder names) per turn.
+COMPILED_CONVERSATION_TEMPLATES: Mapping[
+    str, tuple[tuple[str, tuple[str, ...], tuple[str, ...]], ...]
+] = MappingProxyType(
+    {
+        name: tuple(
+            (role, *_compile_content(content))
+            for role, content in zip(roles, CONVERSATION_CONTENTS[name], strict=True)
+        )
+        for name, roles in CONVERSATION_ROLES.items()
+    }
+)
+
+# The distinct placeholder names used anywhere in each template.
+TEMPLATE_FIELDS: Mapping[str, frozenset[str]] = MappingProxyType(
+    {
+        name: frozenset(field for _, _, fields in turns for field in fields)
+        for name, turns in COMPILED_CONVERSATION_TEMPLATES.items()
+    }
+)
+
 # ---------------------------------------------------------------------------
 # Tool-call templates
-# Each entry describes a canonical tool call schema.
+# Each entry describes a canonical tool call schema.  Generators read these
+# schemas in place rather than copying them, so treat every entry as
+# read-only; the top-level mapping is frozen to enforce that.
 # ---------------------------------------------------------------------------
 
-TOOL_CALL_TEMPLATES: dict[str, dict[str, object]] = {
+_TOOL_CALL_SPECS: dict[str, dict[str, object]] = {
     "search": {
         "name": "web_search",
         "description": "Search the web for current information on a topic.",
@@ -201,4 +283,21 @@ TOOL_CALL_TEMPLATES: dict[str, dict[str, object]] = {
     },
 }
 
-__all__ = ["CONVERSATION_TEMPLATES", "TOOL_CALL_TEMPLATES"]
+TOOL_CALL_TEMPLATES: Mapping[str, dict[str, object]] = MappingProxyType(
+    _TOOL_CALL_SPECS
+)
+
+__all__ = (
+    "COMPILED_CONVERSATION_TEMPLATES",
+    "CONVERSATION_CONTENTS",
+    "CONVERSATION_ROLES",
+    "CONVERSATION_TEMPLATES",
+    "TEMPLATE_FIELDS",
+    "TOOL_CALL_TEMPLATES",
+    "TURN_COUNTS",
+)
+
+
+def __dir__() -> tuple[str, ...]:
+    """Limit ``dir()`` on this module to its public tables."""
+    return __all__
@@ -1,19 +1,29 @@
 """Shared test fixtures for aumai-datasynthesizer."""
-from __future__ import annotations
-
 import pytest
+from click.testing import CliRunner
 from faker import Faker
 
 from aumai_datasynthesizer.core import DataGenerator, SchemaBasedGenerator
 from aumai_datasynthesizer.models import DataType, GeneratorConfig
 
 
-@pytest.fixture()
-def faker_seeded() -> Faker:
-    Faker.seed(42)
+@pytest.fixture(scope="session")
+def _faker() -> Faker:
+    # Building a Faker loads every provider, so the suite shares one instance.
     return Faker()
 
 
+@pytest.fixture()
+def faker_seeded(_faker: Faker) -> Faker:
+    _faker.seed_instance(42)
+    return _faker
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    return CliRunner()
+
+
 @pytest.fixture()
 def generator() -> DataGenerator:
     return DataGenerator()
@@ -1,34 +1,60 @@
 """Comprehensive CLI tests for aumai-datasynthesizer."""
-from __future__ import annotations
-
 import json
+import subprocess
+import sys
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
 
 from aumai_datasynthesizer.cli import main
 
 
+def _jsonl_lines(result: Result) -> list[str]:
+    """Return the non-empty lines a CLI invocation wrote to stdout."""
+    return [ln for ln in result.stdout.splitlines() if ln]
+
+
+# Argument vectors reused across tests.  Tuples, so no test can mutate one in
+# place for the next; ``CliRunner.invoke`` accepts any sequence of strings.
+_ARGV_TEMPLATES_LIST = ("templates", "--list")
+_ARGV_TOOL_CALL_20 = ("generate", "--type", "tool_call", "--count", "20", "--seed", "4")
+
+# (argv, expected line count, key every line must contain or None)
+_GENERATE_STDOUT_MATRIX = (
+    (("generate", "--type", "text", "--count", "3", "--seed", "5"), 3, "text"),
+    (("generate", "--type", "json", "--count", "2", "--seed", "5"), 2, None),
+    (("generate", "--type", "conversation", "--count", "2", "--seed", "5"), 2, "turns"),
+    (("generate", "--type", "tool_call", "--count", "2", "--seed", "5"), 2, None),
+    (("generate", "--type", "agent_trace", "--count", "2", "--seed", "5"), 2, None),
+)
+
+
 # ---------------------------------------------------------------------------
 # Version / help
 # ---------------------------------------------------------------------------
 
 
 class TestCliMeta:
-    def test_version(self) -> None:
-        runner = CliRunner()
+    def test_version(self, runner: CliRunner) -> None:
         result = runner.invoke(main, ["--version"])
         assert result.exit_code == 0
         assert "0.1.0" in result.output
 
-    def test_help(self) -> None:
-        runner = CliRunner()
+    def test_help(self, runner: CliRunner) -> None:
         result = runner.invoke(main, ["--help"])
         assert result.exit_code == 0
         assert "DataSynthesizer" in result.output or "generate" in result.output
 
+    def test_cli_import_does_not_load_faker(self) -> None:
+        code = "import sys, aumai_datasynthesizer.cli; print('faker' in sys.modules)"
+        proc = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert proc.stdout.strip() == "False"
+
 
 # ---------------------------------------------------------------------------
 # `generate` command
@@ -36,69 +62,28 @@ class TestCliMeta:
 
 
 class TestGenerateCommand:
-    def test_generate_requires_type(self) -> None:
-        runner = CliRunner()
+    def test_generate_requires_type(self, runner: CliRunner) -> None:
         result = runner.invoke(main, ["generate"])
         assert result.exit_code != 0
 
-    def test_generate_text_stdout(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(
-            main,
-            ["generate", "--type", "text", "--count", "3", "--seed", "42"],
-        )
+    @pytest.mark.parametrize(("argv", "count", "required_key"), _GENERATE_STDOUT_MATRIX)
+    def test_generate_stdout(
+        self,
+        runner: CliRunner,
+        argv: tuple[str, ...],
+        count: int,
+        required_key: str | None,
+    ) -> None:
+        result = runner.invoke(main, argv)
         assert result.exit_code == 0
-        lines = [ln for ln in result.stdout.strip().split("\n") if ln.strip()]
-        assert len(lines) == 3
+        lines = _jsonl_lines(result)
+        assert len(lines) == count
         for line in lines:
-            obj = json.loads(line)
-            assert "text" in obj
-
-    def test_generate_json_stdout(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(
-            main,
-            ["generate", "--type", "json", "--count", "2", "--seed", "1"],
-        )
-        assert result.exit_code == 0
-        lines = [ln for ln in result.stdout.strip().split("\n") if ln.strip()]
-        assert len(lines) == 2
-
-    def test_generate_conversation_stdout(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(
-            main,
-            ["generate", "--type", "conversation", "--count", "2", "--seed", "5"],
-        )
-        assert result.exit_code == 0
-        lines = [ln for ln in result.stdout.strip().split("\n") if ln.strip()]
-        assert len(lines) == 2
-        for line in lines:
-            obj = json.loads(line)
-            assert "turns" in obj
-
-    def test_generate_tool_call_stdout(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(
-            main,
-            ["generate", "--type", "tool_call", "--count", "2", "--seed", "5"],
-        )
-        assert result.exit_code == 0
-        lines = [ln for ln in result.stdout.strip().split("\n") if ln.strip()]
-        assert len(lines) == 2
-
-    def test_generate_agent_trace_stdout(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(
-            main,
-            ["generate", "--type", "agent_trace", "--count", "2", "--seed", "5"],
-        )
-        assert result.exit_code == 0
-        lines = [ln for ln in result.stdout.strip().split("\n") if ln.strip()]
-        assert len(lines) == 2
+            obj = json.loads(line)  # Should be valid JSON
+            if required_key is not None:
+                assert required_key in obj
 
-    def test_generate_to_file(self) -> None:
-        runner = CliRunner()
+    def test_generate_to_file(self, runner: CliRunner) -> None:
         with runner.isolated_filesystem():
             result = runner.invoke(
                 main,
@@ -112,11 +97,71 @@ class TestGenerateCommand:
             )
             assert result.exit_code == 0
             content = Path("output.jsonl").read_text(encoding="utf-8")
-            lines = [l for l in content.strip().split("\n") if l.strip()]
+            lines = [ln for ln in content.splitlines() if ln]
             assert len(lines) == 4
 
-    def test_generate_with_constraint(self) -> None:
-        runner = CliRunner()
+    def test_generate_failure_keeps_existing_output(
+        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        from aumai_datasynthesizer.core import DataGenerator
+
+        def failing_iter(
+            self: DataGenerator, config: object
+        ) -> Iterator[dict[str, object]]:
+            yield {"id": "first"}
+            raise RuntimeError("generation failed")
+
+        monkeypatch.setattr(DataGenerator, "generate_iter", failing_iter)
+        monkeypatch.setattr("aumai_datasynthesizer.cli._WRITE_BATCH_SIZE", 1)
+        output = tmp_path / "output.jsonl"
+        output.write_text("previous run\n", encoding="utf-8")
+        result = runner.invoke(
+            main, ["generate", "--type", "text", "--output", str(output)]
+        )
+        assert isinstance(result.exception, RuntimeError)
+        assert output.read_text(encoding="utf-8") == "previous run\n"
+        assert [p.name for p in tmp_path.iterdir()] == ["output.jsonl"]
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX modes and symlinks")
+    def test_generate_output_keeps_symlink_and_mode(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        target = tmp_path / "target.jsonl"
+        target.write_text("old\n", encoding="utf-8")
+        target.chmod(0o640)
+        link = tmp_path / "link.jsonl"
+        link.symlink_to(target)
+        for output in (link, target):
+            argv = ["generate", "--type", "text", "--count", "2"]
+            assert runner.invoke(main, [*argv, "--output", str(output)]).exit_code == 0
+            assert link.is_symlink()
+            assert len(target.read_text(encoding="utf-8").splitlines()) == 2
+            assert target.stat().st_mode & 0o777 == 0o640
+        names = sorted(p.name for p in tmp_path.iterdir())
+        assert names == ["link.jsonl", "target.jsonl"]
+
+    def test_generate_output_independent_of_batch_size(
+        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        expected = runner.invoke(main, _ARGV_TOOL_CALL_20).stdout
+        monkeypatch.setattr("aumai_datasynthesizer.cli._WRITE_BATCH_SIZE", 1)
+        result = runner.invoke(main, _ARGV_TOOL_CALL_20)
+        assert result.exit_code == 0
+        assert result.stdout == expected
+        assert len(_jsonl_lines(result)) == 20
+
+    def test_generate_with_workers_matches_serial(self, runner: CliRunner) -> None:
+        argv = ("generate", "--type", "text", "--count", "300", "--seed", "2")
+        expected = runner.invoke(main, argv).stdout
+        result = runner.invoke(main, (*argv, "--workers", "2"))
+        assert result.exit_code == 0
+        assert result.stdout == expected
+
+    def test_generate_rejects_zero_workers(self, runner: CliRunner) -> None:
+        argv = ("generate", "--type", "text", "--workers", "0")
+        assert runner.invoke(main, argv).exit_code != 0
+
+    def test_generate_with_constraint(self, runner: CliRunner) -> None:
         result = runner.invoke(
             main,
             [
@@ -129,8 +174,7 @@ class TestGenerateCommand:
         )
         assert result.exit_code == 0
 
-    def test_generate_invalid_constraint_no_equals(self) -> None:
-        runner = CliRunner()
+    def test_generate_invalid_constraint_no_equals(self, runner: CliRunner) -> None:
         result = runner.invoke(
             main,
             [
@@ -142,8 +186,7 @@ class TestGenerateCommand:
         )
         assert result.exit_code != 0
 
-    def test_generate_with_schema_file(self) -> None:
-        runner = CliRunner()
+    def test_generate_with_schema_file(self, runner: CliRunner) -> None:
         with runner.isolated_filesystem():
             schema = {
                 "type": "object",
@@ -165,47 +208,137 @@ class TestGenerateCommand:
                 ],
             )
             assert result.exit_code == 0
-            lines = [l for l in result.stdout.strip().split("\n") if l.strip()]
+            lines = _jsonl_lines(result)
             assert len(lines) == 3
             for line in lines:
                 obj = json.loads(line)
                 assert "name" in obj
                 assert "score" in obj
 
-    def test_generate_count_min_1(self) -> None:
-        runner = CliRunner()
+    def test_generate_without_orjson_uses_stdlib_json(
+        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr("aumai_datasynthesizer.cli.orjson", None)
+        result = runner.invoke(
+            main,
+            ["generate", "--type", "json", "--count", "2", "--seed", "3"],
+        )
+        assert result.exit_code == 0
+        lines = _jsonl_lines(result)
+        assert len(lines) == 2
+        for line in lines:
+            assert "id" in json.loads(line)
+
+    @pytest.mark.parametrize("data_type", ["conversation", "tool_call", "agent_trace"])
+    def test_generate_output_same_without_orjson(
+        self, runner: CliRunner, monkeypatch: pytest.MonkeyPatch, data_type: str
+    ) -> None:
+        argv = ("generate", "--type", data_type, "--count", "5", "--seed", "8")
+        expected = runner.invoke(main, argv).stdout
+        monkeypatch.setattr("aumai_datasynthesizer.cli.orjson", None)
+        result = runner.invoke(main, argv)
+        assert result.exit_code == 0
+        assert result.stdout == expected
+
+    @pytest.mark.parametrize("mmap_threshold", [0, 16 << 20])
+    def test_generate_keeps_exact_wide_schema_bounds(
+        self,
+        runner: CliRunner,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        mmap_threshold: int,
+    ) -> None:
+        monkeypatch.setattr(
+            "aumai_datasynthesizer.cli._SCHEMA_MMAP_THRESHOLD", mmap_threshold
+        )
+        bound = 12345678901234567890123  # not exactly representable as a float
+        schema = {
+            "type": "object",
+            "properties": {
+                "big": {"type": "integer", "minimum": bound, "maximum": bound},
+                "x": {"type": "number", "minimum": 0.5, "maximum": 0.5},
+            },
+            "required": ["big", "x"],
+        }
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(json.dumps(schema), encoding="utf-8")
+        result = runner.invoke(
+            main,
+            ["generate", "--type", "json", "--count", "2", "--schema", str(schema_file)],
+        )
+        assert result.exit_code == 0
+        for line in _jsonl_lines(result):
+            obj = json.loads(line)
+            assert obj["big"] == bound
+            assert obj["x"] == 0.5
+
+    def test_generate_integers_wider_than_64_bits(
+        self, runner: CliRunner, tmp_path: Path
+    ) -> None:
+        schema = {
+            "type": "object",
+            "properties": {
+                "big": {"type": "integer", "minimum": 10**22, "maximum": 10**23},
+            },
+            "required": ["big"],
+        }
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(json.dumps(schema), encoding="utf-8")
+        result = runner.invoke(
+            main,
+            ["generate", "--type", "json", "--count", "3", "--schema", str(schema_file)],
+        )
+        assert result.exit_code == 0
+        for line in _jsonl_lines(result):
+            assert 10**22 <= json.loads(line)["big"] <= 10**23
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_generate_with_mmapped_schema_file(
+        self,
+        runner: CliRunner,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        use_orjson: bool,
+    ) -> None:
+        monkeypatch.setattr("aumai_datasynthesizer.cli._SCHEMA_MMAP_THRESHOLD", 0)
+        if not use_orjson:
+            monkeypatch.setattr("aumai_datasynthesizer.cli.orjson", None)
+        schema = {
+            "type": "object",
+            "properties": {"score": {"type": "integer"}},
+            "required": ["score"],
+        }
+        schema_file = tmp_path / "schema.json"
+        schema_file.write_text(json.dumps(schema), encoding="utf-8")
+        result = runner.invoke(
+            main,
+            ["generate", "--type", "json", "--count", "2", "--schema", str(schema_file)],
+        )
+        assert result.exit_code == 0
+        lines = _jsonl_lines(result)
+        assert len(lines) == 2
+        for line in lines:
+            assert isinstance(json.loads(line)["score"], int)
+
+    def test_generate_count_min_1(self, runner: CliRunner) -> None:
         result = runner.invoke(
             main, ["generate", "--type", "text", "--count", "0"]
         )
         assert result.exit_code != 0
 
-    def test_generate_invalid_type(self) -> None:
-        runner = CliRunner()
+    def test_generate_invalid_type(self, runner: CliRunner) -> None:
         result = runner.invoke(
             main, ["generate", "--type", "invalid_type"]
         )
         assert result.exit_code != 0
 
-    def test_generate_stderr_reports_count(self) -> None:
-        runner = CliRunner()
+    def test_generate_stderr_reports_count(self, runner: CliRunner) -> None:
         result = runner.invoke(
             main,
             ["generate", "--type", "text", "--count", "5", "--seed", "1"],
         )
         assert result.exit_code == 0
 
-    @pytest.mark.parametrize("data_type", ["text", "json", "conversation", "tool_call", "agent_trace"])
-    def test_all_data_types_generate(self, data_type: str) -> None:
-        runner = CliRunner()
-        result = runner.invoke(
-            main,
-            ["generate", "--type", data_type, "--count", "1", "--seed", "42"],
-        )
-        assert result.exit_code == 0
-        lines = [ln for ln in result.stdout.strip().split("\n") if ln.strip()]
-        assert len(lines) == 1
-        json.loads(lines[0])  # Should be valid JSON
-
 
 # ---------------------------------------------------------------------------
 # `templates` command
@@ -213,48 +346,41 @@ class TestGenerateCommand:
 
 
 class TestTemplatesCommand:
-    def test_templates_requires_list_or_category(self) -> None:
-        runner = CliRunner()
+    def test_templates_requires_list_or_category(self, runner: CliRunner) -> None:
         result = runner.invoke(main, ["templates"])
         assert result.exit_code != 0
 
-    def test_templates_list_all(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(main, ["templates", "--list"])
+    def test_templates_list_all(self, runner: CliRunner) -> None:
+        result = runner.invoke(main, _ARGV_TEMPLATES_LIST)
         assert result.exit_code == 0
         assert "customer_support" in result.output
         assert "code_assistant" in result.output
         assert "research_assistant" in result.output
 
-    def test_templates_list_shows_tool_call_templates(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(main, ["templates", "--list"])
+    def test_templates_list_shows_tool_call_templates(self, runner: CliRunner) -> None:
+        result = runner.invoke(main, _ARGV_TEMPLATES_LIST)
         assert result.exit_code == 0
         assert "search" in result.output
         assert "email" in result.output
 
-    def test_templates_category_conversation(self) -> None:
-        runner = CliRunner()
+    def test_templates_category_conversation(self, runner: CliRunner) -> None:
         result = runner.invoke(main, ["templates", "--category", "conversation"])
         assert result.exit_code == 0
         assert "Conversation Templates" in result.output
 
-    def test_templates_category_tool_call(self) -> None:
-        runner = CliRunner()
+    def test_templates_category_tool_call(self, runner: CliRunner) -> None:
         result = runner.invoke(main, ["templates", "--category", "tool_call"])
         assert result.exit_code == 0
         assert "Tool-Call Templates" in result.output
 
-    def test_templates_category_conversation_excludes_tool_call(self) -> None:
-        runner = CliRunner()
+    def test_templates_category_conversation_excludes_tool_call(self, runner: CliRunner) -> None:
         result = runner.invoke(main, ["templates", "--category", "conversation"])
         assert result.exit_code == 0
         # The tool-call section header should NOT appear
         assert "Tool-Call Templates" not in result.output
 
-    def test_templates_list_shows_turn_counts(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(main, ["templates", "--list"])
+    def test_templates_list_shows_turn_counts(self, runner: CliRunner) -> None:
+        result = runner.invoke(main, _ARGV_TEMPLATES_LIST)
         assert result.exit_code == 0
         # Turn counts appear as "(N turns)" in output
         assert "turns" in result.output
@@ -1,9 +1,13 @@
 """Comprehensive tests for aumai_datasynthesizer core, models, and templates."""
 from __future__ import annotations
 
+import importlib.util
 import json
+import os
 import re
+import sys
 import uuid
+from typing import Any
 
 import pytest
 from faker import Faker
@@ -11,6 +15,7 @@ from faker import Faker
 from aumai_datasynthesizer.core import (
     DataGenerator,
     SchemaBasedGenerator,
+    _STEP_TYPES,
     _render_template,
     _resolve_placeholder,
 )
@@ -20,7 +25,15 @@ from aumai_datasynthesizer.models import (
     GeneratorConfig,
     SyntheticDataset,
 )
-from aumai_datasynthesizer.templates import CONVERSATION_TEMPLATES, TOOL_CALL_TEMPLATES
+from aumai_datasynthesizer.templates import (
+    COMPILED_CONVERSATION_TEMPLATES,
+    CONVERSATION_CONTENTS,
+    CONVERSATION_ROLES,
+    CONVERSATION_TEMPLATES,
+    TEMPLATE_FIELDS,
+    TOOL_CALL_TEMPLATES,
+    TURN_COUNTS,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -29,47 +42,68 @@ from aumai_datasynthesizer.templates import CONVERSATION_TEMPLATES, TOOL_CALL_TE
 
 
 class TestResolveAndRenderHelpers:
-    def test_resolve_known_placeholder_email(self) -> None:
-        faker = Faker()
-        Faker.seed(0)
-        result = _resolve_placeholder("email", faker)
+    def test_resolve_known_placeholder_email(self, faker_seeded: Faker) -> None:
+        result = _resolve_placeholder("email", faker_seeded)
         assert "@" in result
 
-    def test_resolve_known_placeholder_first_name(self) -> None:
-        faker = Faker()
-        result = _resolve_placeholder("first_name", faker)
+    def test_resolve_known_placeholder_first_name(self, faker_seeded: Faker) -> None:
+        result = _resolve_placeholder("first_name", faker_seeded)
         assert isinstance(result, str)
         assert len(result) > 0
 
-    def test_resolve_unknown_placeholder_returns_word(self) -> None:
-        faker = Faker()
-        result = _resolve_placeholder("totally_unknown_placeholder_xyz", faker)
+    def test_resolve_unknown_placeholder_returns_word(
+        self, faker_seeded: Faker
+    ) -> None:
+        result = _resolve_placeholder("totally_unknown_placeholder_xyz", faker_seeded)
         assert isinstance(result, str)
         assert len(result) > 0
 
-    def test_render_template_replaces_placeholder(self) -> None:
-        faker = Faker()
-        Faker.seed(1)
-        result = _render_template("Hello {first_name}!", faker)
+    def test_resolve_placeholder_does_not_mask_provider_errors(self) -> None:
+        class _BrokenFaker:
+            def word(self) -> str:
+                return "fallback"
+
+            def email(self) -> str:
+                raise AttributeError("raised inside the provider")
+
+        broken: Any = _BrokenFaker()
+        assert _resolve_placeholder("first_name", broken) == "fallback"
+        with pytest.raises(AttributeError, match="inside the provider"):
+            _resolve_placeholder("email", broken)
+
+    def test_render_template_replaces_placeholder(self, faker_seeded: Faker) -> None:
+        result = _render_template("Hello {first_name}!", faker_seeded)
         assert "{first_name}" not in result
         assert "Hello " in result
 
-    def test_render_template_multiple_placeholders(self) -> None:
-        faker = Faker()
-        result = _render_template("Hi {first_name}, your email is {email}", faker)
+    def test_render_template_multiple_placeholders(self, faker_seeded: Faker) -> None:
+        text = "Hi {first_name}, your email is {email}"
+        result = _render_template(text, faker_seeded)
         assert "{first_name}" not in result
         assert "{email}" not in result
 
-    def test_render_template_no_placeholders(self) -> None:
-        faker = Faker()
+    def test_render_template_no_placeholders(self, faker_seeded: Faker) -> None:
         text = "No placeholders here."
-        assert _render_template(text, faker) == text
+        assert _render_template(text, faker_seeded) == text
 
-    def test_render_template_order_id(self) -> None:
-        faker = Faker()
-        result = _render_template("Order #{order_id} confirmed", faker)
+    def test_render_template_order_id(self, faker_seeded: Faker) -> None:
+        result = _render_template("Order #{order_id} confirmed", faker_seeded)
         assert "{order_id}" not in result
 
+    def test_render_template_uses_conversation_template_grammar(
+        self, faker_seeded: Faker
+    ) -> None:
+        text = "Ticket {order_id} for {first_name} ({unknown_thing}) {{order_id}}"
+        result = _render_template(text, faker_seeded)
+        assert re.fullmatch(r"Ticket \d{6} for \S+ \(\S+\) \{order_id\}", result)
+
+    def test_compiled_conversation_keeps_roles_in_order(self) -> None:
+        from aumai_datasynthesizer.core import _compiled_conversation
+
+        compiled = _compiled_conversation("customer_support")
+        roles = [role for role, _ in compiled]
+        assert roles == [t["role"] for t in CONVERSATION_TEMPLATES["customer_support"]]
+
 
 class TestTokenize:
     def test_tokenize_basic(self) -> None:
@@ -158,6 +192,33 @@ class TestSchemaBasedGenerator:
         parsed = uuid.UUID(result)
         assert parsed.version == 4
 
+    def test_format_uuid_is_reproducible_with_seeded_rng(self) -> None:
+        import random
+
+        schema = {"type": "string", "format": "uuid"}
+        ids = [
+            SchemaBasedGenerator(Faker(), random.Random(5)).from_schema(schema, 3)
+            for _ in range(2)
+        ]
+        assert ids[0] == ids[1]
+        assert len(set(ids[0])) == 3
+
+    def test_format_uuid_ignores_global_faker_seed(self) -> None:
+        schema = {
+            "type": "object",
+            "properties": {"id": {"type": "string", "format": "uuid"}},
+            "required": ["id"],
+        }
+        schema_gen = SchemaBasedGenerator(Faker())
+        draws = [schema_gen.from_schema]
+        if importlib.util.find_spec("numpy") is not None:
+            draws.append(schema_gen.bulk_generate)
+        for draw in draws:
+            Faker.seed(0)
+            first = draw(schema, 3)
+            Faker.seed(0)
+            assert not {r["id"] for r in first} & {r["id"] for r in draw(schema, 3)}
+
     def test_array_type_returns_list(self, schema_gen: SchemaBasedGenerator) -> None:
         result = schema_gen._generate_value({"type": "array", "items": {"type": "string"}})
         assert isinstance(result, list)
@@ -169,6 +230,37 @@ class TestSchemaBasedGenerator:
             )
             assert 2 <= len(result) <= 4
 
+    def test_array_of_bounded_integers(self, schema_gen: SchemaBasedGenerator) -> None:
+        schema = {
+            "type": "array",
+            "items": {"type": "integer", "minimum": -2, "maximum": 2},
+            "minItems": 3,
+            "maxItems": 3,
+        }
+        for _ in range(20):
+            result = schema_gen._generate_value(schema)
+            assert len(result) == 3
+            assert all(isinstance(v, int) and -2 <= v <= 2 for v in result)
+
+    def test_array_of_integers_wider_than_choices(self) -> None:
+        import random
+
+        from aumai_datasynthesizer.core import _build_plan, _codegen_plan
+
+        lo, hi = -(10**20), 10**20
+        schema = {
+            "type": "array",
+            "items": {"type": "integer", "minimum": lo, "maximum": hi},
+            "minItems": 4,
+            "maxItems": 4,
+        }
+        for plan in (_build_plan(schema), _codegen_plan(schema)):
+            values = plan(Faker(), random.Random(1))
+            assert len(values) == 4
+            assert all(lo <= v <= hi for v in values)
+            # choices() would have collapsed these onto a 2**53 grid.
+            assert any(v % 2**20 for v in values)
+
     def test_nested_object(self, schema_gen: SchemaBasedGenerator) -> None:
         schema = {
             "type": "object",
@@ -198,6 +290,149 @@ class TestSchemaBasedGenerator:
         results = schema_gen.from_schema(schema, 0)
         assert results == []
 
+    def test_from_schema_all_required_properties_always_present(
+        self, schema_gen: SchemaBasedGenerator
+    ) -> None:
+        schema = {
+            "type": "object",
+            "properties": {"a": {"type": "integer"}, "b": {"type": "boolean"}},
+            "required": ["a", "b"],
+        }
+        for result in schema_gen.from_schema(schema, 50):
+            assert list(result) == ["a", "b"]
+
+    def test_compiled_plan_shared_by_equal_schemas(self) -> None:
+        from aumai_datasynthesizer.core import _compile_schema
+
+        schema_a = {"type": "integer", "minimum": 1, "maximum": 3}
+        schema_b = {"type": "integer", "minimum": 1, "maximum": 3}
+        assert _compile_schema(schema_a) is _compile_schema(schema_b)
+
+    def test_bulk_generate_respects_schema(self) -> None:
+        pytest.importorskip("numpy")
+        import random
+
+        schema = {
+            "type": "object",
+            "properties": {
+                "n": {"type": "integer", "minimum": 5, "maximum": 7},
+                "x": {"type": "number", "minimum": 0.0, "maximum": 1.0},
+                "tier": {"type": "string", "enum": ["a", "b"]},
+                "name": {"type": "string"},
+                "flag": {"type": "boolean"},
+                "id": {"type": "string", "format": "uuid"},
+                "email": {"type": "string", "format": "email"},
+            },
+            "required": ["n", "x", "tier", "name", "id", "email"],
+        }
+        rows = []
+        for _ in range(2):
+            faker = Faker()
+            faker.seed_instance(9)
+            schema_gen = SchemaBasedGenerator(faker, random.Random(9))
+            rows.append(schema_gen.bulk_generate(schema, 200))
+        assert rows[0] == rows[1]
+        assert any("flag" not in row for row in rows[0])
+        for row in rows[0]:
+            assert 5 <= row["n"] <= 7 and isinstance(row["n"], int)
+            assert 0.0 <= row["x"] <= 1.0
+            assert row["tier"] in ("a", "b")
+            assert isinstance(row["name"], str)
+            assert uuid.UUID(row["id"]).version == 4
+            assert "@" in row["email"]
+
+    def test_bulk_generate_integers_outside_int64(self) -> None:
+        pytest.importorskip("numpy")
+        import random
+
+        bounds = [(2**62, 2**63), (-(2**70), -(2**63) - 1), (2**63 - 2, 2**63 - 1)]
+        schema = {
+            "type": "object",
+            "properties": {
+                f"n{i}": {"type": "integer", "minimum": lo, "maximum": hi}
+                for i, (lo, hi) in enumerate(bounds)
+            },
+            "required": [f"n{i}" for i in range(len(bounds))],
+        }
+        schema_gen = SchemaBasedGenerator(Faker(), random.Random(2))
+        for row in schema_gen.bulk_generate(schema, 50):
+            for i, (lo, hi) in enumerate(bounds):
+                assert lo <= row[f"n{i}"] <= hi
+
+    def test_non_text_draws_use_rng_only(self) -> None:
+        import random
+
+        schema = {
+            "type": "object",
+            "properties": {
+                "n": {"type": "integer", "minimum": 1, "maximum": 6},
+                "flag": {"type": "boolean"},
+                "rolls": {"type": "array", "items": {"type": "integer"}},
+            },
+            "required": ["n"],
+        }
+        samples = []
+        for faker_seed in (1, 2):
+            faker = Faker()
+            faker.seed_instance(faker_seed)
+            schema_gen = SchemaBasedGenerator(faker, random.Random(7))
+            samples.append(schema_gen.from_schema(schema, 30))
+        # Faker's state does not matter: only the shared RNG seed does.
+        assert samples[0] == samples[1]
+        assert {row["n"] for row in samples[0]} <= set(range(1, 7))
+
+    def test_codegen_plan_matches_closure_plan(self) -> None:
+        import random
+
+        from aumai_datasynthesizer.core import _build_plan, _codegen_plan
+
+        schema = {
+            "type": "object",
+            "properties": {
+                "tier": {"type": "string", "enum": ["a", "b"]},
+                "score": {"type": "number", "minimum": -1, "maximum": 2.5},
+                "items": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "ok": {"type": "boolean"},
+                            "email": {"type": "string", "format": "email"},
+                        },
+                        "required": ["ok"],
+                    },
+                },
+                "extra": {"type": "unknown"},
+                "scores": {
+                    "type": "array",
+                    "items": {"type": "integer", "minimum": 1, "maximum": 3},
+                    "minItems": 0,
+                },
+                "labels": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": ["x", "y"]},
+                },
+            },
+            "required": ["tier", "scores"],
+        }
+        samples = []
+        for plan in (_build_plan(schema), _codegen_plan(schema)):
+            faker = Faker()
+            faker.seed_instance(3)
+            rng = random.Random(3)
+            samples.append([plan(faker, rng) for _ in range(50)])
+        assert samples[0] == samples[1]
+
+    def test_dumps_arguments_keeps_scalar_types_apart(self) -> None:
+        from aumai_datasynthesizer.core import _dumps_arguments
+
+        assert _dumps_arguments({"x": 1}) == '{"x": 1}'
+        assert _dumps_arguments({"x": True}) == '{"x": true}'
+        assert _dumps_arguments({"x": 1.0}) == '{"x": 1.0}'
+        assert _dumps_arguments({"x": [1, 2]}) == '{"x": [1, 2]}'
+        nested = {"q": "caf\u00e9", "tags": ["a"], "opts": {"n": None}}
+        assert _dumps_arguments(nested) == json.dumps(nested)
+
 
 # ---------------------------------------------------------------------------
 # Tests for DataGenerator
@@ -225,6 +460,47 @@ class TestDataGenerator:
         texts_b = generator.generate_text(config)
         assert texts_a == texts_b
 
+    def test_private_rng_is_independent_of_faker_stream(
+        self, generator: DataGenerator
+    ) -> None:
+        # The step count comes from Faker and the step types from the private
+        # RNG; with both seeded alike they were strongly coupled.
+        first_types: dict[bool, set[str]] = {False: set(), True: set()}
+        for seed in range(300):
+            config = GeneratorConfig(data_type=DataType.agent_trace, count=1, seed=seed)
+            steps = generator.generate_agent_traces(config)[0]["steps"]
+            first_types[len(steps) >= 5].add(steps[0]["type"])  # type: ignore[index]
+        assert first_types[False] == first_types[True] == set(_STEP_TYPES)
+
+    def test_seeded_faker_is_reused_per_thread(self, generator: DataGenerator) -> None:
+        import threading
+
+        config = GeneratorConfig(data_type=DataType.text, count=3, seed=99)
+        expected = generator.generate_text(config)
+        generator.generate_text(config.model_copy(update={"seed": 7}))
+        assert generator.generate_text(config) == expected
+
+        faker = generator._make_faker(config)
+        assert generator._make_faker(config) is faker
+        other: list[Faker] = []
+        thread = threading.Thread(
+            target=lambda: other.append(generator._make_faker(config))
+        )
+        thread.start()
+        thread.join()
+        assert other[0] is not faker
+
+    def test_seeded_generation_leaves_global_random_untouched(
+        self, generator: DataGenerator, text_config: GeneratorConfig
+    ) -> None:
+        import random
+
+        random.seed(0)
+        expected = random.random()
+        random.seed(0)
+        generator.generate_text(text_config)
+        assert random.random() == expected
+
     def test_generate_text_respects_max_sentences(self, generator: DataGenerator) -> None:
         config = GeneratorConfig(
             data_type=DataType.text,
@@ -304,6 +580,66 @@ class TestDataGenerator:
             assert "id" in call
             uuid.UUID(str(call["id"]))  # Validates it's a valid UUID
 
+    def test_generate_tool_call_ids_reproducible_with_seed(
+        self, generator: DataGenerator, tool_call_config: GeneratorConfig
+    ) -> None:
+        ids_a = [c["id"] for c in generator.generate_tool_calls(tool_call_config)]
+        ids_b = [c["id"] for c in generator.generate_tool_calls(tool_call_config)]
+        assert ids_a == ids_b
+        assert all(uuid.UUID(str(i)).version == 4 for i in ids_a)
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_unseeded_ids_differ_across_fork(self, generator: DataGenerator) -> None:
+        schema = {
+            "type": "object",
+            "properties": {"id": {"type": "string", "format": "uuid"}},
+            "required": ["id"],
+        }
+
+        def draw_ids() -> list[str]:
+            ids = [
+                c["id"]
+                for c in generator.generate_tool_calls(
+                    GeneratorConfig(data_type=DataType.tool_call, count=2)
+                )
+            ]
+            ids += [
+                t["trace_id"]
+                for t in generator.generate_agent_traces(
+                    GeneratorConfig(data_type=DataType.agent_trace, count=2)
+                )
+            ]
+            ids += [
+                row["id"]
+                for row in generator.generate_json(
+                    GeneratorConfig(data_type=DataType.json, count=2)
+                )
+            ]
+            ids += [
+                row["id"]
+                for row in generator.generate_json(
+                    GeneratorConfig(data_type=DataType.json, count=2, schema=schema)
+                )
+            ]
+            return [str(i) for i in ids]
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            try:
+                os.close(read_fd)
+                with os.fdopen(write_fd, "w") as fh:
+                    json.dump(draw_ids(), fh)
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        parent_ids = draw_ids()
+        with os.fdopen(read_fd) as fh:
+            child_ids = json.load(fh)
+        os.waitpid(pid, 0)
+        assert len(child_ids) == len(parent_ids) == 8
+        assert not set(child_ids) & set(parent_ids)
+
     def test_generate_tool_calls_type_is_function(
         self, generator: DataGenerator, tool_call_config: GeneratorConfig
     ) -> None:
@@ -393,6 +729,16 @@ class TestDataGenerator:
                 assert "type" in step, "each step dict must have a 'type' field"
                 assert "timestamp" in step, "each step dict must have a 'timestamp' field"
 
+    def test_generate_agent_traces_seeded_is_bit_identical(
+        self, generator: DataGenerator, agent_trace_config: GeneratorConfig
+    ) -> None:
+        first = generator.generate_agent_traces(agent_trace_config)
+        second = generator.generate_agent_traces(agent_trace_config)
+        assert first == second
+        for trace in first:
+            timestamps = [step["timestamp"] for step in trace["steps"]]
+            assert timestamps == sorted(timestamps)
+
     def test_generate_json_free_form_count(
         self, generator: DataGenerator, json_config: GeneratorConfig
     ) -> None:
@@ -406,6 +752,15 @@ class TestDataGenerator:
         for item in results:
             assert "id" in item
 
+    def test_generate_json_free_form_value_in_range(
+        self, generator: DataGenerator, json_config: GeneratorConfig
+    ) -> None:
+        for item in generator.generate_json(json_config):
+            value = item["value"]
+            assert isinstance(value, float)
+            assert 0 <= value <= 1000
+            assert round(value, 2) == value
+
     def test_generate_json_schema_driven(self, generator: DataGenerator) -> None:
         schema = {
             "type": "object",
@@ -498,6 +853,61 @@ class TestDataGeneratorDispatcher:
         dataset = generator.generate(text_config)
         assert dataset.config == text_config
 
+    def test_parallel_generate_indices_contiguous(self, generator: DataGenerator) -> None:
+        config = GeneratorConfig(data_type=DataType.text, count=300, seed=7)
+        dataset = generator.generate(config)
+        assert [s["index"] for s in dataset.samples] == list(range(300))
+
+    def test_generate_iter_matches_generate(self, generator: DataGenerator) -> None:
+        config = GeneratorConfig(data_type=DataType.conversation, count=300, seed=3)
+        streamed = generator.generate_iter(config)
+        assert not isinstance(streamed, list)
+        assert list(streamed) == generator.generate(config).samples
+
+    def test_parallel_generate_matches_serial(self, generator: DataGenerator) -> None:
+        config = GeneratorConfig(data_type=DataType.text, count=300, seed=7)
+        serial = generator.generate(config)
+        pooled = DataGenerator(workers=2).generate(config)
+        assert serial.samples == pooled.samples
+
+    def test_generate_does_not_start_a_pool_by_default(
+        self, generator: DataGenerator, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def no_pool(*args: object, **kwargs: object) -> None:
+            raise AssertionError("process pool started")
+
+        monkeypatch.setattr("aumai_datasynthesizer.core.ProcessPoolExecutor", no_pool)
+        config = GeneratorConfig(data_type=DataType.text, count=600, seed=1)
+        assert len(generator.generate(config).samples) == 600
+
+    def test_seeded_runs_share_whole_chunks(self, generator: DataGenerator) -> None:
+        short = GeneratorConfig(data_type=DataType.tool_call, count=256, seed=5)
+        long = short.model_copy(update={"count": 300})
+        assert generator.generate(short).samples == generator.generate(long).samples[:256]
+
+    def test_small_seeded_run_uses_chunk_seeding(self, generator: DataGenerator) -> None:
+        small = GeneratorConfig(data_type=DataType.tool_call, count=63, seed=5)
+        large = small.model_copy(update={"count": 64})
+        ids = [
+            [s["id"] for s in generator.generate(c).samples[:63]] for c in (small, large)
+        ]
+        assert ids[0] == ids[1]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_unseeded_chunked_traces_use_current_time(self, workers: int) -> None:
+        import time
+
+        config = GeneratorConfig(data_type=DataType.agent_trace, count=300)
+        before = time.time()
+        samples = DataGenerator(workers=workers).generate(config).samples
+        first_steps = [s["steps"][0] for s in samples]  # type: ignore[index]
+        assert all(step["timestamp"] >= before for step in first_steps)
+        assert len({s["trace_id"] for s in samples}) == 300
+
+    def test_workers_must_be_positive(self) -> None:
+        with pytest.raises(ValueError, match="workers"):
+            DataGenerator(workers=0)
+
 
 # ---------------------------------------------------------------------------
 # Tests for templates
@@ -520,6 +930,46 @@ class TestTemplates:
                 assert "role" in turn, f"Turn in '{name}' missing 'role'"
                 assert "content" in turn, f"Turn in '{name}' missing 'content'"
 
+    def test_conversation_templates_are_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            CONVERSATION_TEMPLATES["extra"] = []  # type: ignore[index]
+
+    def test_role_and_content_arrays_match_turn_dicts(self) -> None:
+        for name, turns in CONVERSATION_TEMPLATES.items():
+            assert CONVERSATION_ROLES[name] == tuple(t["role"] for t in turns)
+            assert CONVERSATION_CONTENTS[name] == tuple(t["content"] for t in turns)
+            assert TURN_COUNTS[name] == len(turns)
+
+    def test_conversation_roles_are_interned(self) -> None:
+        roles = [role for turns in CONVERSATION_ROLES.values() for role in turns]
+        for role in roles:
+            assert role is sys.intern(role)
+
+    def test_compiled_templates_match_contents(self) -> None:
+        for name, turns in CONVERSATION_TEMPLATES.items():
+            compiled = COMPILED_CONVERSATION_TEMPLATES[name]
+            assert [role for role, _, _ in compiled] == [t["role"] for t in turns]
+            for (_, literals, fields), turn in zip(compiled, turns, strict=True):
+                assert len(literals) == len(fields) + 1
+                placeholders = ["{" + field + "}" for field in fields] + [""]
+                rebuilt = "".join(
+                    literal.replace("{", "{{").replace("}", "}}") + placeholder
+                    for literal, placeholder in zip(literals, placeholders, strict=True)
+                )
+                assert rebuilt == turn["content"]
+
+    def test_template_fields_all_map_to_faker_methods(self) -> None:
+        from aumai_datasynthesizer.core import _FAKER_ATTR_MAP
+
+        for name, fields in TEMPLATE_FIELDS.items():
+            assert fields, f"Template '{name}' has no placeholders"
+            assert fields <= _FAKER_ATTR_MAP.keys()
+
+    def test_compiled_templates_unescape_doubled_braces(self) -> None:
+        for turns in COMPILED_CONVERSATION_TEMPLATES.values():
+            for _, literals, _ in turns:
+                assert not any("{{" in lit or "}}" in lit for lit in literals)
+
     def test_tool_call_templates_exist(self) -> None:
         assert "search" in TOOL_CALL_TEMPLATES
         assert "email" in TOOL_CALL_TEMPLATES
@@ -534,6 +984,16 @@ class TestTemplates:
         for key, spec in TOOL_CALL_TEMPLATES.items():
             assert "parameters" in spec, f"Tool template '{key}' missing 'parameters'"
 
+    def test_tool_call_templates_are_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            TOOL_CALL_TEMPLATES["extra"] = {}  # type: ignore[index]
+
+    def test_module_dir_lists_public_tables(self) -> None:
+        from aumai_datasynthesizer import templates
+
+        assert isinstance(templates.__all__, tuple)
+        assert dir(templates) == sorted(templates.__all__)
+
 
 # ---------------------------------------------------------------------------
 # Tests for models